@@ -11,9 +11,20 @@ import { FacetCreator } from "../src/facetCreator";
 import { FacetLabelPlacer } from "../src/facetLabelPlacer";
 import { FacetResult } from "../src/facetmanagement";
 import { FacetReducer } from "../src/facetReducer";
+import { getResizedDimensions } from "../src/lib/imageSize";
+import { getQuadraticPathData } from "../src/lib/svgPath";
 import { Settings } from "../src/settings";
 import { Point } from "../src/structs/point";
-const svg2img = require("svg2img");
+
+// svg2img (and the rasterizer it pulls in) is only needed for png/jpg output
+// profiles, so it's loaded on first use rather than on every CLI start
+let svg2imgModule: any = null;
+function getSvg2Img(): any {
+    if (svg2imgModule === null) {
+        svg2imgModule = require("svg2img");
+    }
+    return svg2imgModule;
+}
 
 class CLISettingsOutputProfile {
     public name: string = "";
@@ -25,6 +36,8 @@ class CLISettingsOutputProfile {
     public svgFontSize: number = 60;
     public svgFontColor: string = "black";
     public svgStrokeWidth: number = 1;
+    // labels whose bounds are smaller than this (in svg pixels) in either direction are left out, 0 keeps all labels
+    public svgMinLabelSize: number = 0;
 
     public filetype: "svg" | "png" | "jpg" = "svg";
     public filetypeQuality: number = 95;
@@ -58,37 +71,18 @@ async function main() {
     const settings: CLISettings = require(configPath);
 
     const img = await canvas.loadImage(imagePath);
-    const c = canvas.createCanvas(img.width, img.height);
-    const ctx = c.getContext("2d");
-    ctx.drawImage(img, 0, 0, c.width, c.height);
-    let imgData = ctx.getImageData(0, 0, c.width, c.height);
-
-    // resize if required
-    if (settings.resizeImageIfTooLarge && (c.width > settings.resizeImageWidth || c.height > settings.resizeImageHeight)) {
-        let width = c.width;
-        let height = c.height;
-        if (width > settings.resizeImageWidth) {
-            const newWidth = settings.resizeImageWidth;
-            const newHeight = c.height / c.width * settings.resizeImageWidth;
-            width = newWidth;
-            height = newHeight;
-        }
-        if (height > settings.resizeImageHeight) {
-            const newHeight = settings.resizeImageHeight;
-            const newWidth = width / height * newHeight;
-            width = newWidth;
-            height = newHeight;
-        }
 
-        const tempCanvas = canvas.createCanvas(width, height);
-        tempCanvas.width = width;
-        tempCanvas.height = height;
-        tempCanvas.getContext("2d")!.drawImage(c, 0, 0, width, height);
-        c.width = width;
-        c.height = height;
-        ctx.drawImage(tempCanvas, 0, 0, width, height);
-        imgData = ctx.getImageData(0, 0, c.width, c.height);
+    // determine the size up front so the image is drawn only once, straight onto a canvas of the final size
+    const resizedSize = settings.resizeImageIfTooLarge ? getResizedDimensions(img.width, img.height, settings.resizeImageWidth, settings.resizeImageHeight) : null;
+    const width = resizedSize != null ? resizedSize.width : img.width;
+    const height = resizedSize != null ? resizedSize.height : img.height;
 
+    const c = canvas.createCanvas(width, height);
+    const ctx = c.getContext("2d");
+    ctx.drawImage(img, 0, 0, width, height);
+    const imgData = ctx.getImageData(0, 0, c.width, c.height);
+
+    if (resizedSize != null) {
         console.log(`Resized image to ${width}x${height}`);
     }
 
@@ -99,10 +93,9 @@ async function main() {
     ctxKmeans.fillRect(0, 0, cKmeans.width, cKmeans.height);
 
     const kmeansImgData = ctxKmeans.getImageData(0, 0, cKmeans.width, cKmeans.height);
-    await ColorReducer.applyKMeansClustering(imgData as any, kmeansImgData as any, ctx as any, settings, (kmeans) => {
-        const progress = (100 - (kmeans.currentDeltaDistanceDifference > 100 ? 100 : kmeans.currentDeltaDistanceDifference)) / 100;
-        ctxKmeans.putImageData(kmeansImgData, 0, 0);
-    });
+    // no progress callback: nothing shows the intermediate clustering result, and with a callback every
+    // progress update would recolor the whole output image and copy it to the canvas
+    await ColorReducer.applyKMeansClustering(imgData as any, kmeansImgData as any, ctx as any, settings);
 
     const colormapResult = ColorReducer.createColorMap(kmeansImgData as any);
 
@@ -160,14 +153,14 @@ async function main() {
         }
 
         const svgProfilePath = path.join(path.dirname(svgPath), path.basename(svgPath).substr(0, path.basename(svgPath).length - path.extname(svgPath).length) + "-" + profile.name) + "." + profile.filetype;
-        const svgString = await createSVG(facetResult, colormapResult.colorsByIndex, profile.svgSizeMultiplier, profile.svgFillFacets, profile.svgShowBorders, profile.svgShowLabels, profile.svgFontSize, profile.svgFontColor, profile.svgStrokeWidth);
+        const svgString = await createSVG(facetResult, colormapResult.colorsByIndex, profile.svgSizeMultiplier, profile.svgFillFacets, profile.svgShowBorders, profile.svgShowLabels, profile.svgFontSize, profile.svgFontColor, profile.svgStrokeWidth, profile.svgMinLabelSize);
 
         if (profile.filetype === "svg") {
             fs.writeFileSync(svgProfilePath, svgString);
         } else if (profile.filetype === "png") {
 
             const imageBuffer = await new Promise<Buffer>((then, reject) => {
-                svg2img(svgString, function (error: Error, buffer: Buffer) {
+                getSvg2Img()(svgString, function (error: Error, buffer: Buffer) {
                     if (error) {
                         reject(error);
                     } else {
@@ -178,7 +171,7 @@ async function main() {
             fs.writeFileSync(svgProfilePath, imageBuffer);
         } else if (profile.filetype === "jpg") {
             const imageBuffer = await new Promise<Buffer>((then, reject) => {
-                svg2img(svgString, { format: "jpg", quality: profile.filetypeQuality }, function (error: Error, buffer: Buffer) {
+                getSvg2Img()(svgString, { format: "jpg", quality: profile.filetypeQuality }, function (error: Error, buffer: Buffer) {
                     if (error) {
                         reject(error);
                     } else {
@@ -224,15 +217,18 @@ async function main() {
     fs.writeFileSync(palettePath, paletteInfo);
 }
 
-async function createSVG(facetResult: FacetResult, colorsByIndex: RGB[], sizeMultiplier: number, fill: boolean, stroke: boolean, addColorLabels: boolean, fontSize: number = 60, fontColor: string = "black", strokeWidth: number = 1, onUpdate: ((progress: number) => void) | null = null) {
+async function createSVG(facetResult: FacetResult, colorsByIndex: RGB[], sizeMultiplier: number, fill: boolean, stroke: boolean, addColorLabels: boolean, fontSize: number = 60, fontColor: string = "black", strokeWidth: number = 1, minLabelSize: number = 0, onUpdate: ((progress: number) => void) | null = null) {
 
-    let svgString = "";
+    // collect the svg in parts and join them once at the end instead of appending to one growing string
+    const svgParts: string[] = [];
     const xmlns = "http://www.w3.org/2000/svg";
 
     const svgWidth = sizeMultiplier * facetResult.width;
     const svgHeight = sizeMultiplier * facetResult.height;
-    svgString += `<?xml version="1.0" standalone="no"?>
-                  <svg width="${svgWidth}" height="${svgHeight}" xmlns="${xmlns}">`;
+    // format the css color of each palette entry once instead of for every facet
+    const colorStrings = colorsByIndex.map((c) => `rgb(${c[0]},${c[1]},${c[2]})`);
+    svgParts.push(`<?xml version="1.0" standalone="no"?>
+                  <svg width="${svgWidth}" height="${svgHeight}" xmlns="${xmlns}">`);
 
     for (const f of facetResult.facets) {
 
@@ -247,7 +243,7 @@ async function createSVG(facetResult: FacetResult, colorsByIndex: RGB[], sizeMul
                 }
             }
             if (newpath[0].x !== newpath[newpath.length - 1].x || newpath[0].y !== newpath[newpath.length - 1].y) {
-                newpath.push(newpath[0]);
+                newpath = newpath.concat([newpath[0]]);
             } // close loop if necessary
 
             // Create a path in SVG's namespace
@@ -255,13 +251,7 @@ async function createSVG(facetResult: FacetResult, colorsByIndex: RGB[], sizeMul
 
             let svgPathString = "";
 
-            let data = "M ";
-            data += newpath[0].x * sizeMultiplier + " " + newpath[0].y * sizeMultiplier + " ";
-            for (let i: number = 1; i < newpath.length; i++) {
-                const midpointX = (newpath[i].x + newpath[i - 1].x) / 2;
-                const midpointY = (newpath[i].y + newpath[i - 1].y) / 2;
-                data += "Q " + (midpointX * sizeMultiplier) + " " + (midpointY * sizeMultiplier) + " " + (newpath[i].x * sizeMultiplier) + " " + (newpath[i].y * sizeMultiplier) + " ";
-            }
+            const data = getQuadraticPathData(newpath, sizeMultiplier);
 
             let svgStroke = "";
             if (stroke) {
@@ -270,13 +260,13 @@ async function createSVG(facetResult: FacetResult, colorsByIndex: RGB[], sizeMul
                 // make the border the same color as the fill color if there is no border stroke
                 // to not have gaps in between facets
                 if (fill) {
-                    svgStroke = `rgb(${colorsByIndex[f.color][0]},${colorsByIndex[f.color][1]},${colorsByIndex[f.color][2]})`;
+                    svgStroke = colorStrings[f.color];
                 }
             }
 
             let svgFill = "";
             if (fill) {
-                svgFill = `rgb(${colorsByIndex[f.color][0]},${colorsByIndex[f.color][1]},${colorsByIndex[f.color][2]})`;
+                svgFill = colorStrings[f.color];
             } else {
                 svgFill = "none";
             }
@@ -294,7 +284,7 @@ async function createSVG(facetResult: FacetResult, colorsByIndex: RGB[], sizeMul
 
             svgPathString += `</path>`;
 
-            svgString += svgPathString;
+            svgParts.push(svgPathString);
 
             // add the color labels if necessary. I mean, this is the whole idea behind the paint by numbers part
             // so I don't know why you would hide them
@@ -305,6 +295,11 @@ async function createSVG(facetResult: FacetResult, colorsByIndex: RGB[], sizeMul
                 const labelWidth = f.labelBounds.width * sizeMultiplier;
                 const labelHeight = f.labelBounds.height * sizeMultiplier;
 
+                if (labelWidth < minLabelSize || labelHeight < minLabelSize) {
+                    // too small to be readable, leave it out rather than adding text nobody can read
+                    continue;
+                }
+
                 //     const svgLabelString = `<g class="label" transform="translate(${labelOffsetX},${labelOffsetY})">
                 //     <svg width="${labelWidth}" height="${labelHeight}" overflow="visible" viewBox="-50 -50 100 100" preserveAspectRatio="xMidYMid meet">
                 //         <rect xmlns="http://www.w3.org/2000/svg" width="100%" height="100%" fill="rgb(255,255,255,0.5)" x="-50" y="-50"/>
@@ -319,14 +314,14 @@ async function createSVG(facetResult: FacetResult, colorsByIndex: RGB[], sizeMul
                                         </svg>
                                        </g>`;
 
-                svgString += svgLabelString;
+                svgParts.push(svgLabelString);
             }
         }
     }
 
-    svgString += `</svg>`;
+    svgParts.push(`</svg>`);
 
-    return svgString;
+    return svgParts.join("");
 }
 
 main().then(() => {
@@ -2,12 +2,12 @@
  * Color reduction management of the process: clustering to reduce colors & creating color map
  */
 import { delay, IMap, RGB } from "./common";
-import { KMeans, Vector } from "./lib/clustering";
+import { KMeans, KMeansInitialization, Vector } from "./lib/clustering";
 import { hslToRgb, lab2rgb, rgb2lab, rgbToHsl } from "./lib/colorconversion";
 import { ClusteringColorSpace, Settings } from "./settings";
 import { Uint8Array2D } from "./structs/typedarrays";
 import { Random } from "./random";
-import { BIT_CONSTANTS, UPDATE_INTERVALS, RANDOM_SEED_CONSTANTS } from "./lib/constants";
+import { BIT_CONSTANTS, CLUSTERING_DEFAULTS, UPDATE_INTERVALS, RANDOM_SEED_CONSTANTS } from "./lib/constants";
 
 export class ColorMapResult {
     public imgColorIndices!: Uint8Array2D;
@@ -24,25 +24,33 @@ export class ColorReducer {
     public static createColorMap(kmeansImgData: ImageData) {
         const imgColorIndices = new Uint8Array2D(kmeansImgData.width, kmeansImgData.height);
         let colorIndex = 0;
-        const colors: IMap<number> = {};
+        // keyed by the packed 24 bit rgb value, no string building per pixel
+        const colors = new Map<number, number>();
         const colorsByIndex: RGB[] = [];
 
+        // neighbouring pixels mostly share the same color after clustering, skip the lookup for those
+        let lastColorKey = -1;
+        let currentColorIndex = 0;
+
         let idx = 0;
         for (let j: number = 0; j < kmeansImgData.height; j++) {
             for (let i: number = 0; i < kmeansImgData.width; i++) {
                 const r = kmeansImgData.data[idx++];
                 const g = kmeansImgData.data[idx++];
                 const b = kmeansImgData.data[idx++];
-                const a = kmeansImgData.data[idx++];
-                let currentColorIndex;
-                const color = r + "," + g + "," + b;
-                if (typeof colors[color] === "undefined") {
-                    currentColorIndex = colorIndex;
-                    colors[color] = colorIndex;
-                    colorsByIndex.push([r, g, b]);
-                    colorIndex++;
-                } else {
-                    currentColorIndex = colors[color];
+                idx++; // alpha
+                const colorKey = (r << 16) | (g << 8) | b;
+                if (colorKey !== lastColorKey) {
+                    const existingIndex = colors.get(colorKey);
+                    if (typeof existingIndex === "undefined") {
+                        currentColorIndex = colorIndex;
+                        colors.set(colorKey, colorIndex);
+                        colorsByIndex.push([r, g, b]);
+                        colorIndex++;
+                    } else {
+                        currentColorIndex = existingIndex;
+                    }
+                    lastColorKey = colorKey;
                 }
                 imgColorIndices.set(i, j, currentColorIndex);
             }
@@ -117,14 +125,22 @@ export class ColorReducer {
 
         const random = new Random(settings.randomSeed === RANDOM_SEED_CONSTANTS.USE_CURRENT_TIME ? new Date().getTime() : settings.randomSeed);
         // vectors of all the unique colors are built, time to cluster them
-        const kmeans = new KMeans(vectors, settings.kMeansNrOfClusters, random);
+        // settings files written before the option existed don't have it, treat missing as the default (on)
+        const initialization = settings.kMeansPlusPlusInitialization === false ? KMeansInitialization.Random : KMeansInitialization.PlusPlus;
+        const kmeans = new KMeans(vectors, settings.kMeansNrOfClusters, random, null, initialization);
 
         let curTime = new Date().getTime();
         const progressUpdateInterval = UPDATE_INTERVALS.PROGRESS_UPDATE_MS;
 
-        kmeans.step();
-        while (kmeans.currentDeltaDistanceDifference > settings.kMeansMinDeltaDifference) {
-            kmeans.step();
+        // mini-batches only pay off when there are a lot more unique colors than the batch size
+        const miniBatchSize = settings.kMeansMiniBatchSize > 0 && vectors.length > settings.kMeansMiniBatchSize ? settings.kMeansMiniBatchSize : 0;
+        const nextStep = miniBatchSize > 0 ? () => kmeans.stepMiniBatch(miniBatchSize) : () => kmeans.step();
+
+        nextStep();
+        // sampling noise can keep mini-batch centroids jittering around the threshold, so cap the iterations
+        while (kmeans.currentDeltaDistanceDifference > settings.kMeansMinDeltaDifference &&
+               (miniBatchSize === 0 || kmeans.currentIteration < CLUSTERING_DEFAULTS.MAX_ITERATIONS)) {
+            nextStep();
 
             // update GUI at regular intervals
             const now = new Date().getTime();
@@ -133,6 +149,10 @@ export class ColorReducer {
 
                 await delay(0);
                 if (onUpdate != null) {
+                    if (miniBatchSize > 0) {
+                        // mini-batch steps don't assign the points, do that here or the preview stays empty
+                        kmeans.assignPoints();
+                    }
                     ColorReducer.updateKmeansOutputImageData(kmeans, settings, pointsByColor, imgData, outputImgData, false);
                     onUpdate(kmeans);
                 }
@@ -140,6 +160,11 @@ export class ColorReducer {
 
         }
 
+        if (miniBatchSize > 0) {
+            // mini-batch steps only move the centroids, assign every color once at the end
+            kmeans.step();
+        }
+
         // update the output image data (because it will be used for further processing)
         ColorReducer.updateKmeansOutputImageData(kmeans, settings, pointsByColor, imgData, outputImgData, true);
 
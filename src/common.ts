@@ -5,9 +5,19 @@ export interface IMap<T> {
     [key: string]: T;
 }
 
+// browsers clamp nested timeouts to at least 4ms, and the processing steps call delay(0) every few
+// hundred items to keep the page responsive. Zero delays only give control back to the browser when
+// this much time has passed since they last did, which is still frequent enough to repaint the progress
+const MIN_YIELD_INTERVAL_MS = 16;
+let lastYieldTime = 0;
+
 export async function delay(ms: number) {
     if (typeof window !== "undefined") {
-        return new Promise<void>((exec) => (<any> window).setTimeout(exec, ms));
+        if (ms <= 0 && Date.now() - lastYieldTime < MIN_YIELD_INTERVAL_MS) {
+            return;
+        }
+        await new Promise<void>((exec) => (<any> window).setTimeout(exec, ms));
+        lastYieldTime = Date.now();
     } else {
         return new Promise<void>((exec) => exec());
     }
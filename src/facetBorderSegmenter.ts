@@ -55,11 +55,13 @@ export class FacetBorderSegmenter {
                 if (f.borderPath.length > 1) {
                     let currentPoints: PathPoint[] = [];
                     currentPoints.push(f.borderPath[0]);
+                    // carry the neighbour over to the next point so it's only looked up once per point
+                    let curNeighbour = f.borderPath[0].getNeighbour(facetResult);
                     for (let i: number = 1; i < f.borderPath.length; i++) {
                         const prevBorderPoint = f.borderPath[i - 1];
                         const curBorderPoint = f.borderPath[i];
-                        const oldNeighbour = prevBorderPoint.getNeighbour(facetResult);
-                        const curNeighbour = curBorderPoint.getNeighbour(facetResult);
+                        const oldNeighbour = curNeighbour;
+                        curNeighbour = curBorderPoint.getNeighbour(facetResult);
                         let isTransitionPoint = false;
                         if (oldNeighbour !== curNeighbour) {
                             isTransitionPoint = true;
@@ -125,7 +127,7 @@ export class FacetBorderSegmenter {
                     // the points to the first segment if they have the same neighbour or construct a
                     // new segment
                     if (currentPoints.length > 1) {
-                        const oldNeighbour = f.borderPath[f.borderPath.length - 1].getNeighbour(facetResult);
+                        const oldNeighbour = curNeighbour;
                         if (segments.length > 0 && segments[0].neighbour === oldNeighbour) {
                             // the first segment and the remainder of the last one are the same part
                             // add the current points to the first segment by prefixing it
@@ -170,28 +172,32 @@ export class FacetBorderSegmenter {
         if (newpath.length <= FACET_THRESHOLDS.MIN_PATH_LENGTH_FOR_REDUCTION) {
             return newpath;
         }
-        const reducedPath: PathPoint[] = [];
-        reducedPath.push(newpath[0]);
-        for (let i: number = 1; i < newpath.length - 2; i += 2) {
-            if (!skipOutsideBorders || (skipOutsideBorders && !FacetBorderSegmenter.isOutsideBorderPoint(newpath[i], width, height))) {
-                const cx = (newpath[i].x + newpath[i + 1].x) / 2;
-                const cy = (newpath[i].y + newpath[i + 1].y) / 2;
-                reducedPath.push(new PathPoint(new Point(cx, cy), OrientationEnum.Left));
+        // every pair of points becomes at most 2 points, so the reduced path is never longer than the input
+        const reducedPath: PathPoint[] = new Array(newpath.length);
+        let reducedLength = 0;
+        reducedPath[reducedLength++] = newpath[0];
+        // points on the outer edge of the image are kept as is, so the outside border stays straight
+        const maxX = width - 1;
+        const maxY = height - 1;
+        const end = newpath.length - 2;
+        for (let i: number = 1; i < end; i += 2) {
+            const pt = newpath[i];
+            const nextPt = newpath[i + 1];
+            const isOutsideBorderPoint = pt.x === 0 || pt.y === 0 || pt.x === maxX || pt.y === maxY;
+            if (!skipOutsideBorders || !isOutsideBorderPoint) {
+                reducedPath[reducedLength++] = PathPoint.at((pt.x + nextPt.x) / 2, (pt.y + nextPt.y) / 2, OrientationEnum.Left);
             }
             else {
-                reducedPath.push(newpath[i]);
-                reducedPath.push(newpath[i + 1]);
+                reducedPath[reducedLength++] = pt;
+                reducedPath[reducedLength++] = nextPt;
             }
         }
         // close the loop
-        reducedPath.push(newpath[newpath.length - 1]);
+        reducedPath[reducedLength++] = newpath[newpath.length - 1];
+        reducedPath.length = reducedLength;
         return reducedPath;
     }
 
-    private static isOutsideBorderPoint(point: Point, width: number, height: number) {
-        return point.x === 0 || point.y === 0 || point.x === width - 1 || point.y === height - 1;
-    }
-
     private static calculateArea(path: Point[]) {
         let total = 0;
         for (let i = 0; i < path.length; i++) {
@@ -236,25 +242,26 @@ export class FacetBorderSegmenter {
                             let matchFound = false;
                             if (neighbourFacet != null) {
                                 const neighbourSegments = segmentsPerFacet[segment.neighbour];
+                                const segStartPoint = segment.points[0];
+                                const segEndPoint = segment.points[segment.points.length - 1];
                                 for (let ns: number = 0; ns < neighbourSegments.length; ns++) {
                                     const neighbourSegment = neighbourSegments[ns];
                                     // only try to match against the segments that aren't processed yet
                                     // and which are adjacent to the boundary of the current facet
                                     if (neighbourSegment != null && neighbourSegment.neighbour === f.id) {
-                                        const segStartPoint = segment.points[0];
-                                        const segEndPoint = segment.points[segment.points.length - 1];
                                         const nSegStartPoint = neighbourSegment.points[0];
                                         const nSegEndPoint = neighbourSegment.points[neighbourSegment.points.length - 1];
-                                        let matchesStraight = (segStartPoint.distanceTo(nSegStartPoint) <= MAX_DISTANCE &&
-                                            segEndPoint.distanceTo(nSegEndPoint) <= MAX_DISTANCE);
-                                        let matchesReverse = (segStartPoint.distanceTo(nSegEndPoint) <= MAX_DISTANCE &&
-                                            segEndPoint.distanceTo(nSegStartPoint) <= MAX_DISTANCE);
+                                        const distanceStartStart = segStartPoint.distanceTo(nSegStartPoint);
+                                        const distanceEndEnd = segEndPoint.distanceTo(nSegEndPoint);
+                                        const distanceStartEnd = segStartPoint.distanceTo(nSegEndPoint);
+                                        const distanceEndStart = segEndPoint.distanceTo(nSegStartPoint);
+                                        let matchesStraight = (distanceStartStart <= MAX_DISTANCE && distanceEndEnd <= MAX_DISTANCE);
+                                        let matchesReverse = (distanceStartEnd <= MAX_DISTANCE && distanceEndStart <= MAX_DISTANCE);
                                         if (matchesStraight && matchesReverse) {
                                             // dang it , both match, it must be a tiny segment, but when placed wrongly it'll overlap in the path creating an hourglass 
                                             //  e.g. https://i.imgur.com/XZQhxRV.png
                                             // determine which is the closest
-                                            if (segStartPoint.distanceTo(nSegStartPoint) + segEndPoint.distanceTo(nSegEndPoint) <
-                                                segStartPoint.distanceTo(nSegEndPoint) + segEndPoint.distanceTo(nSegStartPoint)) {
+                                            if (distanceStartStart + distanceEndEnd < distanceStartEnd + distanceEndStart) {
                                                 matchesStraight = true;
                                                 matchesReverse = false;
                                             }
@@ -1,8 +1,8 @@
 import { delay } from "./common";
-import { Point } from "./structs/point";
 import { BooleanArray2D } from "./structs/typedarrays";
 import { FacetResult, PathPoint, OrientationEnum, Facet } from "./facetmanagement";
 import { isInBounds } from "./lib/boundaryUtils";
+import { SEGMENTATION_CONSTANTS } from "./lib/constants";
 
 export class FacetBorderTracer {
     
@@ -11,23 +11,47 @@ export class FacetBorderTracer {
      *  Imagine placing walls around the outer side of the border points.
      */
     public static async buildFacetBorderPaths(facetResult: FacetResult, onUpdate: ((progress: number) => void) | null = null) {
+        // nothing to trace, don't bother allocating the image sized masks
+        if (!facetResult.facets.some((f) => f != null)) {
+            if (onUpdate != null) {
+                onUpdate(1);
+            }
+            return;
+        }
         let count = 0;
         const borderMask = new BooleanArray2D(facetResult.width, facetResult.height);
-        // sort by biggest facets first
-        const facetProcessingOrder = facetResult.facets.filter((f) => f != null).slice(0).sort((a, b) => b!.pointCount > a!.pointCount ? 1 : (b!.pointCount < a!.pointCount ? -1 : 0)).map((f) => f!.id);
+        // keep track of which walls are already set on each pixel
+        // e.g. xWall.get(x,y) is the left wall of point x,y
+        // as the left wall of (x+1,y) and right wall of (x,y) is the same
+        // the right wall of x,y can be set with xWall.set(x+1,y).
+        // Analogous for the horizontal walls in yWall
+        // The walls of a facet never extend past its bounding box + 1, so instead of allocating
+        // new arrays for every facet only that region is cleared before tracing it
+        const xWall = new BooleanArray2D(facetResult.width + 1, facetResult.height + 1);
+        const yWall = new BooleanArray2D(facetResult.width + 1, facetResult.height + 1);
+        // each facet is traced on its own, so visit them in Z-order (Morton order) of the tile their
+        // bounding box starts in. Facets traced after each other then touch nearby parts of the
+        // facet map and masks, which are more likely to still be in cache
+        const tileBits = SEGMENTATION_CONSTANTS.TRACE_TILE_SIZE_BITS;
+        const tileOrder = new Uint32Array(facetResult.facets.length);
+        const facetProcessingOrder: number[] = [];
+        for (const f of facetResult.facets) {
+            if (f != null) {
+                tileOrder[f.id] = FacetBorderTracer.getMortonCode(f.bbox.minX >> tileBits, f.bbox.minY >> tileBits);
+                facetProcessingOrder.push(f.id);
+            }
+        }
+        facetProcessingOrder.sort((a, b) => tileOrder[a] - tileOrder[b]);
         for (let fidx: number = 0; fidx < facetProcessingOrder.length; fidx++) {
             const f = facetResult.facets[facetProcessingOrder[fidx]]!;
             if (f != null) {
                 for (const bp of f.borderPoints) {
                     borderMask.set(bp.x, bp.y, true);
                 }
-                // keep track of which walls are already set on each pixel
-                // e.g. xWall.get(x,y) is the left wall of point x,y
-                // as the left wall of (x+1,y) and right wall of (x,y) is the same
-                // the right wall of x,y can be set with xWall.set(x+1,y).
-                // Analogous for the horizontal walls in yWall
-                const xWall = new BooleanArray2D(facetResult.width + 1, facetResult.height + 1);
-                const yWall = new BooleanArray2D(facetResult.width + 1, facetResult.height + 1);
+                const wallRegionWidth = f.bbox.maxX - f.bbox.minX + 2;
+                const wallRegionHeight = f.bbox.maxY - f.bbox.minY + 2;
+                xWall.fillRect(f.bbox.minX, f.bbox.minY, wallRegionWidth, wallRegionHeight, false);
+                yWall.fillRect(f.bbox.minX, f.bbox.minY, wallRegionWidth, wallRegionHeight, false);
                 // the first border point will guaranteed be one of the outer ones because
                 // it will be the first point that is encountered of the facet when building
                 // them in buildFacet with DFS.
@@ -82,6 +106,10 @@ export class FacetBorderTracer {
         let finished = false;
         const count = 0;
         const path: PathPoint[] = [];
+        // every step does a handful of lookups, keep them in locals
+        const facetMap = facetResult.facetMap;
+        const width = facetResult.width;
+        const height = facetResult.height;
         FacetBorderTracer.addPointToPath(path, pt, xWall, f, yWall);
         // check rotations first, then straight along the ouside and finally diagonally
         // this ensures that bends are always taken as tight as possible
@@ -93,7 +121,7 @@ export class FacetBorderTracer {
             // yes, technically i could do some trickery to only get the left/top cases
             // by shifting the pixels but that means some more shenanigans in correct order of things
             // so whatever. (And yes I tried it but it wasn't worth the debugging hell that ensued)
-            const possibleNextPoints: PathPoint[] = [];
+            let nextPt: PathPoint | null = null;
             //   +---+---+
             //   |  <|   |
             //   +---+---+
@@ -104,15 +132,14 @@ export class FacetBorderTracer {
                 //   +---xnnnn (x = old wall, n = new wall, F = current facet x,y)
                 //   |   x F |
                 //   +---x---+
-                if (((pt.y - 1 >= 0 && facetResult.facetMap.get(pt.x, pt.y - 1) !== f.id) // top exists and is a neighbour facet
+                if (((pt.y - 1 >= 0 && facetMap.get(pt.x, pt.y - 1) !== f.id) // top exists and is a neighbour facet
                     || pt.y - 1 < 0) // or top doesn't exist, which is the boundary of the image
                     && !yWall.get(pt.x, pt.y)) { // and the wall isn't set yet
                     // can place top _ wall at x,y
                     if (debug) {
                         console.log("can place top _ wall at x,y");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x, pt.y), OrientationEnum.Top);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x, pt.y, OrientationEnum.Top);
                 }
                 // check rotate to bottom
                 //   +---+---+
@@ -120,15 +147,14 @@ export class FacetBorderTracer {
                 //   +---x---+ (x = old wall, n = new wall, F = current facet x,y)
                 //   |   x F |
                 //   +---xnnnn
-                if (((pt.y + 1 < facetResult.height && facetResult.facetMap.get(pt.x, pt.y + 1) !== f.id) // bottom exists and is a neighbour facet
-                    || pt.y + 1 >= facetResult.height) // or bottom doesn't exist, which is the boundary of the image
+                else if (((pt.y + 1 < height && facetMap.get(pt.x, pt.y + 1) !== f.id) // bottom exists and is a neighbour facet
+                    || pt.y + 1 >= height) // or bottom doesn't exist, which is the boundary of the image
                     && !yWall.get(pt.x, pt.y + 1)) { // and the wall isn't set yet
                     // can place bottom  _ wall at x,y
                     if (debug) {
                         console.log("can place bottom _ wall at x,y");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x, pt.y), OrientationEnum.Bottom);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x, pt.y, OrientationEnum.Bottom);
                 }
                 // check upwards
                 //   +---n---+
@@ -136,17 +162,16 @@ export class FacetBorderTracer {
                 //   +---x---+ (x = old wall, n = new wall, F = current facet x,y)
                 //   |   x F |
                 //   +---x---+
-                if (pt.y - 1 >= 0 // top exists
-                    && facetResult.facetMap.get(pt.x, pt.y - 1) === f.id // and is part of the same facet
-                    && (pt.x - 1 < 0 || facetResult.facetMap.get(pt.x - 1, pt.y - 1) !== f.id) // and
+                else if (pt.y - 1 >= 0 // top exists
+                    && facetMap.get(pt.x, pt.y - 1) === f.id // and is part of the same facet
+                    && (pt.x - 1 < 0 || facetMap.get(pt.x - 1, pt.y - 1) !== f.id) // and
                     && borderMask.get(pt.x, pt.y - 1)
                     && !xWall.get(pt.x, pt.y - 1)) {
                     // can place | wall at x,y-1
                     if (debug) {
                         console.log(`can place left | wall at x,y-1`);
                     }
-                    const nextpt = new PathPoint(new Point(pt.x, pt.y - 1), OrientationEnum.Left);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x, pt.y - 1, OrientationEnum.Left);
                 }
                 // check downwards
                 //   +---x---+
@@ -154,17 +179,16 @@ export class FacetBorderTracer {
                 //   +---x---+ (x = old wall, n = new wall, F = current facet x,y)
                 //   |   n   |
                 //   +---n---+
-                if (pt.y + 1 < facetResult.height
-                    && facetResult.facetMap.get(pt.x, pt.y + 1) === f.id
-                    && (pt.x - 1 < 0 || facetResult.facetMap.get(pt.x - 1, pt.y + 1) !== f.id)
+                else if (pt.y + 1 < height
+                    && facetMap.get(pt.x, pt.y + 1) === f.id
+                    && (pt.x - 1 < 0 || facetMap.get(pt.x - 1, pt.y + 1) !== f.id)
                     && borderMask.get(pt.x, pt.y + 1)
                     && !xWall.get(pt.x, pt.y + 1)) {
                     // can place | wall at x,y+1
                     if (debug) {
                         console.log("can place left | wall at x,y+1");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x, pt.y + 1), OrientationEnum.Left);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x, pt.y + 1, OrientationEnum.Left);
                 }
                 // check left upwards
                 //   +---+---+
@@ -172,8 +196,8 @@ export class FacetBorderTracer {
                 //   nnnnx---+ (x = old wall, n = new wall, F = current facet x,y)
                 //   |   x F |
                 //   +---x---+
-                if (pt.y - 1 >= 0 && pt.x - 1 >= 0 // there is a left upwards
-                    && facetResult.facetMap.get(pt.x - 1, pt.y - 1) === f.id // and it belongs to the same facet
+                else if (pt.y - 1 >= 0 && pt.x - 1 >= 0 // there is a left upwards
+                    && facetMap.get(pt.x - 1, pt.y - 1) === f.id // and it belongs to the same facet
                     && borderMask.get(pt.x - 1, pt.y - 1) // and is on the border
                     && !yWall.get(pt.x - 1, pt.y - 1 + 1) // and the bottom wall isn't set yet
                     && !yWall.get(pt.x, pt.y) // and the path didn't come from the top of the current one to prevent getting a T shaped path (issue: https://i.imgur.com/ggUWuXi.png)
@@ -182,8 +206,7 @@ export class FacetBorderTracer {
                     if (debug) {
                         console.log("can place bottom _ wall at x-1,y-1");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x - 1, pt.y - 1), OrientationEnum.Bottom);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x - 1, pt.y - 1, OrientationEnum.Bottom);
                 }
                 // check left downwards
                 //   +---x---+
@@ -191,8 +214,8 @@ export class FacetBorderTracer {
                 //   nnnnx---+ (x = old wall, n = new wall, F = current facet x,y)
                 //   |   |   |
                 //   +---+---+
-                if (pt.y + 1 < facetResult.height && pt.x - 1 >= 0 // there is a left downwards
-                    && facetResult.facetMap.get(pt.x - 1, pt.y + 1) === f.id // and belongs to the same facet
+                else if (pt.y + 1 < height && pt.x - 1 >= 0 // there is a left downwards
+                    && facetMap.get(pt.x - 1, pt.y + 1) === f.id // and belongs to the same facet
                     && borderMask.get(pt.x - 1, pt.y + 1) // and is on the border
                     && !yWall.get(pt.x - 1, pt.y + 1) // and the top wall isn't set yet
                     && !yWall.get(pt.x, pt.y + 1) // and the path didn't come from the bottom of the current point to prevent T shape
@@ -201,64 +224,59 @@ export class FacetBorderTracer {
                     if (debug) {
                         console.log("can place top _ wall at x-1,y+1");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x - 1, pt.y + 1), OrientationEnum.Top);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x - 1, pt.y + 1, OrientationEnum.Top);
                 }
             }
             else if (pt.orientation === OrientationEnum.Top) {
                 // check rotate to left
                 if (((pt.x - 1 >= 0
-                    && facetResult.facetMap.get(pt.x - 1, pt.y) !== f.id)
+                    && facetMap.get(pt.x - 1, pt.y) !== f.id)
                     || pt.x - 1 < 0)
                     && !xWall.get(pt.x, pt.y)) {
                     // can place left | wall at x,y
                     if (debug) {
                         console.log("can place left | wall at x,y");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x, pt.y), OrientationEnum.Left);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x, pt.y, OrientationEnum.Left);
                 }
                 // check rotate to right
-                if (((pt.x + 1 < facetResult.width
-                    && facetResult.facetMap.get(pt.x + 1, pt.y) !== f.id)
-                    || pt.x + 1 >= facetResult.width)
+                else if (((pt.x + 1 < width
+                    && facetMap.get(pt.x + 1, pt.y) !== f.id)
+                    || pt.x + 1 >= width)
                     && !xWall.get(pt.x + 1, pt.y)) {
                     // can place right | wall at x,y
                     if (debug) {
                         console.log("can place right | wall at x,y");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x, pt.y), OrientationEnum.Right);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x, pt.y, OrientationEnum.Right);
                 }
                 // check leftwards
-                if (pt.x - 1 >= 0
-                    && facetResult.facetMap.get(pt.x - 1, pt.y) === f.id
-                    && (pt.y - 1 < 0 || facetResult.facetMap.get(pt.x - 1, pt.y - 1) !== f.id)
+                else if (pt.x - 1 >= 0
+                    && facetMap.get(pt.x - 1, pt.y) === f.id
+                    && (pt.y - 1 < 0 || facetMap.get(pt.x - 1, pt.y - 1) !== f.id)
                     && borderMask.get(pt.x - 1, pt.y)
                     && !yWall.get(pt.x - 1, pt.y)) {
                     // can place top _ wall at x-1,y
                     if (debug) {
                         console.log(`can place top _ wall at x-1,y`);
                     }
-                    const nextpt = new PathPoint(new Point(pt.x - 1, pt.y), OrientationEnum.Top);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x - 1, pt.y, OrientationEnum.Top);
                 }
                 // check rightwards
-                if (pt.x + 1 < facetResult.width
-                    && facetResult.facetMap.get(pt.x + 1, pt.y) === f.id
-                    && (pt.y - 1 < 0 || facetResult.facetMap.get(pt.x + 1, pt.y - 1) !== f.id)
+                else if (pt.x + 1 < width
+                    && facetMap.get(pt.x + 1, pt.y) === f.id
+                    && (pt.y - 1 < 0 || facetMap.get(pt.x + 1, pt.y - 1) !== f.id)
                     && borderMask.get(pt.x + 1, pt.y)
                     && !yWall.get(pt.x + 1, pt.y)) {
                     // can place top _ wall at x+1,y
                     if (debug) {
                         console.log(`can place top _ wall at x+1,y`);
                     }
-                    const nextpt = new PathPoint(new Point(pt.x + 1, pt.y), OrientationEnum.Top);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x + 1, pt.y, OrientationEnum.Top);
                 }
                 // check left upwards
-                if (pt.y - 1 >= 0 && pt.x - 1 >= 0 // there is a left upwards
-                    && facetResult.facetMap.get(pt.x - 1, pt.y - 1) === f.id // and it belongs to the same facet
+                else if (pt.y - 1 >= 0 && pt.x - 1 >= 0 // there is a left upwards
+                    && facetMap.get(pt.x - 1, pt.y - 1) === f.id // and it belongs to the same facet
                     && borderMask.get(pt.x - 1, pt.y - 1) // and it's part of the border
                     && !xWall.get(pt.x - 1 + 1, pt.y - 1) // the right wall isn't set yet
                     && !xWall.get(pt.x, pt.y) // and the left wall of the current point isn't set yet to prevent |- path
@@ -267,12 +285,11 @@ export class FacetBorderTracer {
                     if (debug) {
                         console.log("can place right | wall at x-1,y-1");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x - 1, pt.y - 1), OrientationEnum.Right);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x - 1, pt.y - 1, OrientationEnum.Right);
                 }
                 // check right upwards
-                if (pt.y - 1 >= 0 && pt.x + 1 < facetResult.width // there is a right upwards
-                    && facetResult.facetMap.get(pt.x + 1, pt.y - 1) === f.id // and it belongs to the same facet
+                else if (pt.y - 1 >= 0 && pt.x + 1 < width // there is a right upwards
+                    && facetMap.get(pt.x + 1, pt.y - 1) === f.id // and it belongs to the same facet
                     && borderMask.get(pt.x + 1, pt.y - 1) // and it's on the border
                     && !xWall.get(pt.x + 1, pt.y - 1) // and the left wall isn't set yet
                     && !xWall.get(pt.x + 1, pt.y) // and the right wall of the current point isn't set yet to prevent -| path
@@ -281,64 +298,59 @@ export class FacetBorderTracer {
                     if (debug) {
                         console.log("can place left |  wall at x+1,y-1");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x + 1, pt.y - 1), OrientationEnum.Left);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x + 1, pt.y - 1, OrientationEnum.Left);
                 }
             }
             else if (pt.orientation === OrientationEnum.Right) {
                 // check rotate to top
                 if (((pt.y - 1 >= 0
-                    && facetResult.facetMap.get(pt.x, pt.y - 1) !== f.id)
+                    && facetMap.get(pt.x, pt.y - 1) !== f.id)
                     || pt.y - 1 < 0)
                     && !yWall.get(pt.x, pt.y)) {
                     // can place top _ wall at x,y
                     if (debug) {
                         console.log("can place top _ wall at x,y");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x, pt.y), OrientationEnum.Top);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x, pt.y, OrientationEnum.Top);
                 }
                 // check rotate to bottom
-                if (((pt.y + 1 < facetResult.height
-                    && facetResult.facetMap.get(pt.x, pt.y + 1) !== f.id)
-                    || pt.y + 1 >= facetResult.height)
+                else if (((pt.y + 1 < height
+                    && facetMap.get(pt.x, pt.y + 1) !== f.id)
+                    || pt.y + 1 >= height)
                     && !yWall.get(pt.x, pt.y + 1)) {
                     // can place bottom  _ wall at x,y
                     if (debug) {
                         console.log("can place bottom _ wall at x,y");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x, pt.y), OrientationEnum.Bottom);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x, pt.y, OrientationEnum.Bottom);
                 }
                 // check upwards
-                if (pt.y - 1 >= 0
-                    && facetResult.facetMap.get(pt.x, pt.y - 1) === f.id
-                    && (pt.x + 1 >= facetResult.width || facetResult.facetMap.get(pt.x + 1, pt.y - 1) !== f.id)
+                else if (pt.y - 1 >= 0
+                    && facetMap.get(pt.x, pt.y - 1) === f.id
+                    && (pt.x + 1 >= width || facetMap.get(pt.x + 1, pt.y - 1) !== f.id)
                     && borderMask.get(pt.x, pt.y - 1)
                     && !xWall.get(pt.x + 1, pt.y - 1)) {
                     // can place right | wall at x,y-1
                     if (debug) {
                         console.log(`can place right | wall at x,y-1`);
                     }
-                    const nextpt = new PathPoint(new Point(pt.x, pt.y - 1), OrientationEnum.Right);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x, pt.y - 1, OrientationEnum.Right);
                 }
                 // check downwards
-                if (pt.y + 1 < facetResult.height
-                    && facetResult.facetMap.get(pt.x, pt.y + 1) === f.id
-                    && (pt.x + 1 >= facetResult.width || facetResult.facetMap.get(pt.x + 1, pt.y + 1) !== f.id)
+                else if (pt.y + 1 < height
+                    && facetMap.get(pt.x, pt.y + 1) === f.id
+                    && (pt.x + 1 >= width || facetMap.get(pt.x + 1, pt.y + 1) !== f.id)
                     && borderMask.get(pt.x, pt.y + 1)
                     && !xWall.get(pt.x + 1, pt.y + 1)) {
                     // can place right | wall at x,y+1
                     if (debug) {
                         console.log("can place right | wall at x,y+1");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x, pt.y + 1), OrientationEnum.Right);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x, pt.y + 1, OrientationEnum.Right);
                 }
                 // check right upwards
-                if (pt.y - 1 >= 0 && pt.x + 1 < facetResult.width // there is a right upwards
-                    && facetResult.facetMap.get(pt.x + 1, pt.y - 1) === f.id // and belongs to the same facet
+                else if (pt.y - 1 >= 0 && pt.x + 1 < width // there is a right upwards
+                    && facetMap.get(pt.x + 1, pt.y - 1) === f.id // and belongs to the same facet
                     && borderMask.get(pt.x + 1, pt.y - 1) // and is on the border
                     && !yWall.get(pt.x + 1, pt.y - 1 + 1) // and the bottom wall isn't set yet
                     && !yWall.get(pt.x, pt.y) // and the top wall of the current point isn't set to prevent a T shape
@@ -347,12 +359,11 @@ export class FacetBorderTracer {
                     if (debug) {
                         console.log("can place bottom _ wall at x+1,y-1");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x + 1, pt.y - 1), OrientationEnum.Bottom);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x + 1, pt.y - 1, OrientationEnum.Bottom);
                 }
                 // check right downwards
-                if (pt.y + 1 < facetResult.height && pt.x + 1 < facetResult.width // there is a right downwards
-                    && facetResult.facetMap.get(pt.x + 1, pt.y + 1) === f.id // and belongs to the same facet
+                else if (pt.y + 1 < height && pt.x + 1 < width // there is a right downwards
+                    && facetMap.get(pt.x + 1, pt.y + 1) === f.id // and belongs to the same facet
                     && borderMask.get(pt.x + 1, pt.y + 1) // and is on the border
                     && !yWall.get(pt.x + 1, pt.y + 1) // and the top wall isn't visited yet
                     && !yWall.get(pt.x, pt.y + 1) // and the bottom wall of the current point isn't set to prevent a T shape
@@ -361,64 +372,59 @@ export class FacetBorderTracer {
                     if (debug) {
                         console.log("can place top _ wall at x+1,y+1");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x + 1, pt.y + 1), OrientationEnum.Top);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x + 1, pt.y + 1, OrientationEnum.Top);
                 }
             }
             else if (pt.orientation === OrientationEnum.Bottom) {
                 // check rotate to left
                 if (((pt.x - 1 >= 0
-                    && facetResult.facetMap.get(pt.x - 1, pt.y) !== f.id)
+                    && facetMap.get(pt.x - 1, pt.y) !== f.id)
                     || pt.x - 1 < 0)
                     && !xWall.get(pt.x, pt.y)) {
                     // can place left | wall at x,y
                     if (debug) {
                         console.log("can place left | wall at x,y");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x, pt.y), OrientationEnum.Left);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x, pt.y, OrientationEnum.Left);
                 }
                 // check rotate to right
-                if (((pt.x + 1 < facetResult.width
-                    && facetResult.facetMap.get(pt.x + 1, pt.y) !== f.id)
-                    || pt.x + 1 >= facetResult.width)
+                else if (((pt.x + 1 < width
+                    && facetMap.get(pt.x + 1, pt.y) !== f.id)
+                    || pt.x + 1 >= width)
                     && !xWall.get(pt.x + 1, pt.y)) {
                     // can place right | wall at x,y
                     if (debug) {
                         console.log("can place right | wall at x,y");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x, pt.y), OrientationEnum.Right);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x, pt.y, OrientationEnum.Right);
                 }
                 // check leftwards
-                if (pt.x - 1 >= 0
-                    && facetResult.facetMap.get(pt.x - 1, pt.y) === f.id
-                    && (pt.y + 1 >= facetResult.height || facetResult.facetMap.get(pt.x - 1, pt.y + 1) !== f.id)
+                else if (pt.x - 1 >= 0
+                    && facetMap.get(pt.x - 1, pt.y) === f.id
+                    && (pt.y + 1 >= height || facetMap.get(pt.x - 1, pt.y + 1) !== f.id)
                     && borderMask.get(pt.x - 1, pt.y)
                     && !yWall.get(pt.x - 1, pt.y + 1)) {
                     // can place bottom _ wall at x-1,y
                     if (debug) {
                         console.log(`can place bottom _ wall at x-1,y`);
                     }
-                    const nextpt = new PathPoint(new Point(pt.x - 1, pt.y), OrientationEnum.Bottom);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x - 1, pt.y, OrientationEnum.Bottom);
                 }
                 // check rightwards
-                if (pt.x + 1 < facetResult.width
-                    && facetResult.facetMap.get(pt.x + 1, pt.y) === f.id
-                    && (pt.y + 1 >= facetResult.height || facetResult.facetMap.get(pt.x + 1, pt.y + 1) !== f.id)
+                else if (pt.x + 1 < width
+                    && facetMap.get(pt.x + 1, pt.y) === f.id
+                    && (pt.y + 1 >= height || facetMap.get(pt.x + 1, pt.y + 1) !== f.id)
                     && borderMask.get(pt.x + 1, pt.y)
                     && !yWall.get(pt.x + 1, pt.y + 1)) {
                     // can place top _ wall at x+1,y
                     if (debug) {
                         console.log(`can place bottom _ wall at x+1,y`);
                     }
-                    const nextpt = new PathPoint(new Point(pt.x + 1, pt.y), OrientationEnum.Bottom);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x + 1, pt.y, OrientationEnum.Bottom);
                 }
                 // check left downwards
-                if (pt.y + 1 < facetResult.height && pt.x - 1 >= 0 // there is a left downwards
-                    && facetResult.facetMap.get(pt.x - 1, pt.y + 1) === f.id // and it's the same facet
+                else if (pt.y + 1 < height && pt.x - 1 >= 0 // there is a left downwards
+                    && facetMap.get(pt.x - 1, pt.y + 1) === f.id // and it's the same facet
                     && borderMask.get(pt.x - 1, pt.y + 1) // and it's on the border
                     && !xWall.get(pt.x - 1 + 1, pt.y + 1) // and the right wall isn't set yet
                     && !xWall.get(pt.x, pt.y) // and the left wall of the current point isn't set yet to prevent |- path
@@ -427,12 +433,11 @@ export class FacetBorderTracer {
                     if (debug) {
                         console.log("can place right | wall at x-1,y+1");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x - 1, pt.y + 1), OrientationEnum.Right);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x - 1, pt.y + 1, OrientationEnum.Right);
                 }
                 // check right downwards
-                if (pt.y + 1 < facetResult.height && pt.x + 1 < facetResult.width // there is a right downwards
-                    && facetResult.facetMap.get(pt.x + 1, pt.y + 1) === f.id // and it's the same facet
+                else if (pt.y + 1 < height && pt.x + 1 < width // there is a right downwards
+                    && facetMap.get(pt.x + 1, pt.y + 1) === f.id // and it's the same facet
                     && borderMask.get(pt.x + 1, pt.y + 1) // and it's on the border
                     && !xWall.get(pt.x + 1, pt.y + 1) // and the left wall isn't set yet
                     && !xWall.get(pt.x + 1, pt.y) // and the right wall of the current point isn't set yet to prevent -| path
@@ -441,19 +446,14 @@ export class FacetBorderTracer {
                     if (debug) {
                         console.log("can place left |  wall at x+1,y+1");
                     }
-                    const nextpt = new PathPoint(new Point(pt.x + 1, pt.y + 1), OrientationEnum.Left);
-                    possibleNextPoints.push(nextpt);
+                    nextPt = PathPoint.at(pt.x + 1, pt.y + 1, OrientationEnum.Left);
                 }
             }
 
-            if (possibleNextPoints.length > 1) {
-                // TODO it's now not necessary anymore to aggregate all possibilities, the first one is going to be the correct
-                // selection to trace the entire border, so the if checks above can include a skip once ssible point is found again
-                pt = possibleNextPoints[0];
-                FacetBorderTracer.addPointToPath(path, pt, xWall, f, yWall);
-            }
-            else if (possibleNextPoints.length === 1) {
-                pt = possibleNextPoints[0];
+            // the first possible point is always the right one to trace the entire border,
+            // so the checks above are chained and stop at the first match
+            if (nextPt !== null) {
+                pt = nextPt;
                 FacetBorderTracer.addPointToPath(path, pt, xWall, f, yWall);
             }
             else {
@@ -480,6 +480,25 @@ export class FacetBorderTracer {
         return path;
     }
 
+    /**
+     * Interleaves the bits of x and y (both below 2^16) into their Z-order curve index
+     */
+    private static getMortonCode(x: number, y: number) {
+        return (FacetBorderTracer.spreadBits(x) | (FacetBorderTracer.spreadBits(y) << 1)) >>> 0;
+    }
+
+    /**
+     * Spreads the lower 16 bits of the value out to the even bits
+     */
+    private static spreadBits(v: number) {
+        v &= 0xFFFF;
+        v = (v | (v << 8)) & 0x00FF00FF;
+        v = (v | (v << 4)) & 0x0F0F0F0F;
+        v = (v | (v << 2)) & 0x33333333;
+        v = (v | (v << 1)) & 0x55555555;
+        return v;
+    }
+
     /**
      * Add a point to the border path and ensure the correct xWall/yWalls is set
      */
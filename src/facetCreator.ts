@@ -1,5 +1,4 @@
-import { delay, IMap, RGB } from "./common";
-import { getNeighbors4 } from "./lib/boundaryUtils";
+import { delay, RGB } from "./common";
 import { FacetBuilder } from "./lib/FacetBuilder";
 import { Point } from "./structs/point";
 import { BooleanArray2D, Uint32Array2D, Uint8Array2D } from "./structs/typedarrays";
@@ -66,23 +65,38 @@ export class FacetCreator {
      * Check which neighbour facets the given facet has by checking the neighbour facets at each border point
      */
     public static buildFacetNeighbour(facet: Facet, facetResult: FacetResult) {
-        facet.neighbourFacets = [];
-        const uniqueFacets: IMap<boolean> = {}; // poor man's set
+        const uniqueFacets = new Set<number>();
+        const facetMap = facetResult.facetMap;
+        const maxX = facetResult.width - 1;
+        const maxY = facetResult.height - 1;
+        const facetId = facet.id;
+        // check the 4-connected neighbours within bounds inline, this runs for every border point
+        // of every facet and again on each facet reduction, so don't allocate points for them
         for (const pt of facet.borderPoints) {
-            // Get all 4-connected neighbors within bounds
-            const neighbors = getNeighbors4(pt.x, pt.y, facetResult.width, facetResult.height);
-            for (const neighbor of neighbors) {
-                const neighborFacetId = facetResult.facetMap.get(neighbor.x, neighbor.y);
-                if (neighborFacetId !== facet.id) {
-                    uniqueFacets[neighborFacetId] = true;
-                }
+            const x = pt.x;
+            const y = pt.y;
+            if (y > 0) {
+                const id = facetMap.get(x, y - 1);
+                if (id !== facetId) { uniqueFacets.add(id); }
             }
-        }
-        for (const k of Object.keys(uniqueFacets)) {
-            if (uniqueFacets.hasOwnProperty(k)) {
-                facet.neighbourFacets.push(parseInt(k));
+            if (y < maxY) {
+                const id = facetMap.get(x, y + 1);
+                if (id !== facetId) { uniqueFacets.add(id); }
+            }
+            if (x > 0) {
+                const id = facetMap.get(x - 1, y);
+                if (id !== facetId) { uniqueFacets.add(id); }
+            }
+            if (x < maxX) {
+                const id = facetMap.get(x + 1, y);
+                if (id !== facetId) { uniqueFacets.add(id); }
             }
         }
+        const neighbourFacets: number[] = [];
+        uniqueFacets.forEach((id) => neighbourFacets.push(id));
+        // keep them in ascending order, like the object keys they used to be collected in
+        neighbourFacets.sort((a, b) => a - b);
+        facet.neighbourFacets = neighbourFacets;
         // the neighbour array is updated so it's not dirty anymore
         facet.neighbourFacetsIsDirty = false;
     }
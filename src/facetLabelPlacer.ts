@@ -16,12 +16,26 @@ export class FacetLabelPlacer {
      *  within the facet as additional polygon rings (why does everything look so easy to do yet never is under the hood :/)
      */
     public static async buildFacetLabelBounds(facetResult: FacetResult, onUpdate: ((progress: number) => void) | null = null) {
+        // every facet is also a neighbour of several others, so build the border paths (from the segments, which can
+        // have been reduced compared to facet actual border path) and their bounds once instead of for every facet it borders
+        const borderPaths: Array<Point[] | null> = new Array(facetResult.facets.length);
+        const borderPathBounds: Array<BoundingBox | null> = new Array(facetResult.facets.length);
+        for (let i: number = 0; i < facetResult.facets.length; i++) {
+            const f = facetResult.facets[i];
+            if (f != null) {
+                borderPaths[i] = f.getFullPathFromBorderSegments(true);
+                borderPathBounds[i] = FacetLabelPlacer.getPathBounds(borderPaths[i]!);
+            } else {
+                borderPaths[i] = null;
+                borderPathBounds[i] = null;
+            }
+        }
+
         let count = 0;
         for (const f of facetResult.facets) {
             if (f != null) {
                 const polyRings: Point[][] = [];
-                // get the border path from the segments (that can have been reduced compared to facet actual border path)
-                const borderPath = f.getFullPathFromBorderSegments(true);
+                const borderPath = borderPaths[f.id]!;
                 // outer path must be first ring
                 polyRings.push(borderPath);
                 const onlyOuterRing = [borderPath];
@@ -32,8 +46,8 @@ export class FacetLabelPlacer {
                     FacetCreator.buildFacetNeighbour(f, facetResult);
                 }
                 for (const neighbourIdx of f.neighbourFacets!) {
-                    const neighbourPath = facetResult.facets[neighbourIdx]!.getFullPathFromBorderSegments(true);
-                    const fallsInside: boolean = FacetLabelPlacer.doesNeighbourFallInsideInCurrentFacet(neighbourPath, f, onlyOuterRing);
+                    const neighbourPath = borderPaths[neighbourIdx]!;
+                    const fallsInside: boolean = FacetLabelPlacer.doesNeighbourFallInsideInCurrentFacet(neighbourPath, borderPathBounds[neighbourIdx]!, f, onlyOuterRing);
                     if (fallsInside) {
                         polyRings.push(neighbourPath);
                     }
@@ -61,20 +75,28 @@ export class FacetLabelPlacer {
     }
     
     /**
-     *  Checks whether a neighbour border path is fully within the current facet border path
+     *  Determines the bounds of the points of a border path
      */
-    private static doesNeighbourFallInsideInCurrentFacet(neighbourPath: Point[], f: Facet, onlyOuterRing: Point[][]) {
-        let fallsInside: boolean = true;
-        // fast test to see if the neighbour falls inside the bbox of the facet
-        for (let i: number = 0; i < neighbourPath.length && fallsInside; i++) {
-            if (neighbourPath[i].x >= f.bbox.minX && neighbourPath[i].x <= f.bbox.maxX &&
-                neighbourPath[i].y >= f.bbox.minY && neighbourPath[i].y <= f.bbox.maxY) {
-                // ok
-            }
-            else {
-                fallsInside = false;
-            }
+    private static getPathBounds(path: Point[]) {
+        const bounds = new BoundingBox();
+        for (const pt of path) {
+            if (pt.x < bounds.minX) { bounds.minX = pt.x; }
+            if (pt.y < bounds.minY) { bounds.minY = pt.y; }
+            if (pt.x > bounds.maxX) { bounds.maxX = pt.x; }
+            if (pt.y > bounds.maxY) { bounds.maxY = pt.y; }
         }
+        return bounds;
+    }
+
+    /**
+     *  Checks whether a neighbour border path is fully within the current facet border path
+     */
+    private static doesNeighbourFallInsideInCurrentFacet(neighbourPath: Point[], neighbourPathBounds: BoundingBox, f: Facet, onlyOuterRing: Point[][]) {
+        // fast test to see if the neighbour falls inside the bbox of the facet: all the points of the path
+        // are within the bbox when the corners of the bounds of the path are
+        const bbox = f.bbox;
+        let fallsInside: boolean = neighbourPath.length === 0 ||
+            (bbox.contains(neighbourPathBounds.minX, neighbourPathBounds.minY) && bbox.contains(neighbourPathBounds.maxX, neighbourPathBounds.maxY));
         if (fallsInside) {
             // do a more fine grained but more expensive check to see if each of the points fall within the polygon
             for (let i: number = 0; i < neighbourPath.length && fallsInside; i++) {
@@ -7,6 +7,33 @@ import { UPDATE_INTERVALS } from "./lib/constants";
 
 export class FacetReducer {
 
+    /**
+     *  Returns the facet with the least points, on ties the one with the highest id.
+     *  A single pass over the facets instead of sorting all of them for every removal
+     */
+    private static getSmallestFacet(facetResult: FacetResult) {
+        let smallest: Facet | null = null;
+        for (const f of facetResult.facets) {
+            if (f != null && (smallest === null || f.pointCount <= smallest.pointCount)) {
+                smallest = f;
+            }
+        }
+        return smallest;
+    }
+
+    /**
+     *  Returns the number of facets that haven't been removed
+     */
+    private static countFacets(facetResult: FacetResult) {
+        let count = 0;
+        for (const f of facetResult.facets) {
+            if (f != null) {
+                count++;
+            }
+        }
+        return count;
+    }
+
     /**
      *  Remove all facets that have a pointCount smaller than the given number.
      */
@@ -47,7 +74,7 @@ export class FacetReducer {
 
         }
 
-        let facetCount = facetResult.facets.filter(f => f != null).length;
+        let facetCount = FacetReducer.countFacets(facetResult);
         if (facetCount > maximumNumberOfFacets) {
             console.log(`There are still ${facetCount} facets, more than the maximum of ${maximumNumberOfFacets}. Removing the smallest facets`);
         }
@@ -55,17 +82,11 @@ export class FacetReducer {
         const startFacetCount = facetCount;
         while (facetCount > maximumNumberOfFacets) {
 
-            // because facets can be merged, reevaluate the order of facets to make sure the smallest one is removed 
-            // this is slower but more accurate
-            const facetProcessingOrder = facetResult.facets.filter((f) => f != null).slice(0)
-                .sort((a, b) => b!.pointCount > a!.pointCount ? 1 : (b!.pointCount < a!.pointCount ? -1 : 0))
-                .map((f) => f!.id)
-                .reverse();
-
-            const facetToRemove = facetResult.facets[facetProcessingOrder[0]];
+            // because facets can be merged, reevaluate which facet is the smallest before every removal
+            const facetToRemove = FacetReducer.getSmallestFacet(facetResult);
 
             FacetReducer.deleteFacet(facetToRemove!.id, facetResult, imgColorIndices, colorDistances, visitedCache);
-            facetCount = facetResult.facets.filter(f => f != null).length;
+            facetCount = FacetReducer.countFacets(facetResult);
 
             if (new Date().getTime() - curTime > UPDATE_INTERVALS.PROGRESS_UPDATE_MS) {
                 curTime = new Date().getTime();
@@ -296,8 +317,8 @@ export class FacetReducer {
         }
         // reset the visited array for all neighbours
         // while the visited array could be recreated per facet to remove, it's quite big and introduces
-        // a lot of allocation / cleanup overhead. Due to the size of the facets it's usually faster
-        // to just flag every point of the facet as false again
+        // a lot of allocation / cleanup overhead. Only the rebuilt neighbours were flagged and everything
+        // else is already false, so clearing their bounding boxes resets the array with row fills
         if (facetToRemove.neighbourFacetsIsDirty) {
             FacetCreator.buildFacetNeighbour(facetToRemove, facetResult);
         }
@@ -305,13 +326,8 @@ export class FacetReducer {
         for (const neighbourIdx of facetToRemove.neighbourFacets!) {
             const neighbour = facetResult.facets[neighbourIdx];
             if (neighbour != null) {
-                for (let y: number = neighbour.bbox.minY; y <= neighbour.bbox.maxY; y++) {
-                    for (let x: number = neighbour.bbox.minX; x <= neighbour.bbox.maxX; x++) {
-                        if (facetResult.facetMap.get(x, y) === neighbour.id) {
-                            visitedArrayCache.set(x, y, false);
-                        }
-                    }
-                }
+                const bbox = neighbour.bbox;
+                visitedArrayCache.fillRect(bbox.minX, bbox.minY, bbox.maxX - bbox.minX + 1, bbox.maxY - bbox.minY + 1, false);
             }
         }
         // rebuild neighbour array for affected neighbours
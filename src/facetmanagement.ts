@@ -13,59 +13,50 @@ export enum OrientationEnum {
     Bottom,
 }
 
+// PathPoint copies the coordinates, so PathPoint.at can pass the same point every time
+const scratchPoint = new Point(0, 0);
+
+// offset to the pixel on the other side of the wall, indexed by OrientationEnum
+const NEIGHBOUR_OFFSET_X = [-1, 0, 1, 0];
+const NEIGHBOUR_OFFSET_Y = [0, -1, 0, 1];
+// offset from the pixel center to the wall, indexed by OrientationEnum
+const WALL_OFFSET_X = [-0.5, 0, 0.5, 0];
+const WALL_OFFSET_Y = [0, -0.5, 0, 0.5];
+
 /**
  * PathPoint is a point with an orientation that indicates which wall border is set
  */
 export class PathPoint extends Point {
 
+    /**
+     *  Creates a path point at the given coordinates, without allocating a Point
+     *  to pass in first (border tracing creates one of these for every step)
+     */
+    public static at(x: number, y: number, orientation: OrientationEnum) {
+        scratchPoint.x = x;
+        scratchPoint.y = y;
+        return new PathPoint(scratchPoint, orientation);
+    }
+
     constructor(pt: Point, public orientation: OrientationEnum) {
         super(pt.x, pt.y);
     }
 
     public getWallX() {
-        let x = this.x;
-        if (this.orientation === OrientationEnum.Left) {
-            x -= 0.5;
-        } else if (this.orientation === OrientationEnum.Right) {
-            x += 0.5;
-        }
-        return x;
+        return this.x + WALL_OFFSET_X[this.orientation];
     }
 
     public getWallY() {
-        let y = this.y;
-        if (this.orientation === OrientationEnum.Top) {
-            y -= 0.5;
-        } else if (this.orientation === OrientationEnum.Bottom) {
-            y += 0.5;
-        }
-        return y;
+        return this.y + WALL_OFFSET_Y[this.orientation];
     }
 
     public getNeighbour(facetResult: FacetResult) {
-        switch (this.orientation) {
-            case OrientationEnum.Left:
-                if (this.x - 1 >= 0) {
-                    return facetResult.facetMap.get(this.x - 1, this.y);
-                }
-                break;
-            case OrientationEnum.Right:
-                if (this.x + 1 < facetResult.width) {
-                    return facetResult.facetMap.get(this.x + 1, this.y);
-                }
-                break;
-            case OrientationEnum.Top:
-                if (this.y - 1 >= 0) {
-                    return facetResult.facetMap.get(this.x, this.y - 1);
-                }
-                break;
-            case OrientationEnum.Bottom:
-                if (this.y + 1 < facetResult.height) {
-                    return facetResult.facetMap.get(this.x, this.y + 1);
-                }
-                break;
+        const x = this.x + NEIGHBOUR_OFFSET_X[this.orientation];
+        const y = this.y + NEIGHBOUR_OFFSET_Y[this.orientation];
+        if (x < 0 || y < 0 || x >= facetResult.width || y >= facetResult.height) {
+            return -1;
         }
-        return -1;
+        return facetResult.facetMap.get(x, y);
     }
 
     public toString() {
@@ -101,33 +92,73 @@ export class Facet {
 
     public labelBounds!: BoundingBox;
 
+    // the full paths are requested by the label placer and again for every svg that's generated, but they only
+    // change when the border segments are rebuilt. They're cached for the border segments array they were built from
+    private fullPathSegments: FacetBoundarySegment[] | null = null;
+    private fullPath: Point[] | null = null;
+    private fullWallPath: Point[] | null = null;
+
+    /**
+     *  Returns the border path built from the border segments, either with the pixel coordinates or the wall coordinates
+     *  of the points. The path is cached and shared between calls, so it must not be modified
+     */
     public getFullPathFromBorderSegments(useWalls: boolean) {
-        const newpath: Point[] = [];
+        if (this.fullPathSegments !== this.borderSegments) {
+            this.fullPathSegments = this.borderSegments;
+            this.fullPath = null;
+            this.fullWallPath = null;
+        }
+        if (useWalls) {
+            if (this.fullWallPath == null) {
+                this.fullWallPath = this.buildFullPathFromBorderSegments(true);
+            }
+            return this.fullWallPath;
+        } else {
+            if (this.fullPath == null) {
+                this.fullPath = this.buildFullPathFromBorderSegments(false);
+            }
+            return this.fullPath;
+        }
+    }
+
+    private buildFullPathFromBorderSegments(useWalls: boolean) {
+        const segments = this.borderSegments;
+
+        // every segment adds its points, every segment after the first also repeats the last point of the previous one
+        let length = segments.length > 0 ? segments.length - 1 : 0;
+        for (const seg of segments) {
+            length += seg.originalSegment.points.length;
+        }
+        const newpath: Point[] = new Array(length);
+        let count = 0;
 
         const addPoint = (pt: PathPoint) => {
             if (useWalls) {
-                newpath.push(new Point(pt.getWallX(), pt.getWallY()));
+                newpath[count++] = new Point(pt.x + WALL_OFFSET_X[pt.orientation], pt.y + WALL_OFFSET_Y[pt.orientation]);
             } else {
-                newpath.push(new Point(pt.x, pt.y));
+                newpath[count++] = new Point(pt.x, pt.y);
             }
         };
 
         let lastSegment: FacetBoundarySegment | null = null;
-        for (const seg of this.borderSegments) {
+        for (const seg of segments) {
 
             // fix for the continuitity of the border segments. If transition points between border segments on the path aren't repeated, the
             // borders of the facets aren't always matching up leaving holes when rendered
             if (lastSegment != null) {
-                if (lastSegment.reverseOrder) {
-                    addPoint(lastSegment.originalSegment.points[0]);
-                } else {
-                    addPoint(lastSegment.originalSegment.points[lastSegment.originalSegment.points.length - 1]);
-                }
+                const lastPoints = lastSegment.originalSegment.points;
+                addPoint(lastSegment.reverseOrder ? lastPoints[0] : lastPoints[lastPoints.length - 1]);
             }
 
-            for (let i: number = 0; i < seg.originalSegment.points.length; i++) {
-                const idx = seg.reverseOrder ? (seg.originalSegment.points.length - 1 - i) : i;
-                addPoint(seg.originalSegment.points[idx]);
+            const points = seg.originalSegment.points;
+            if (seg.reverseOrder) {
+                for (let i: number = points.length - 1; i >= 0; i--) {
+                    addPoint(points[i]);
+                }
+            } else {
+                for (let i: number = 0; i < points.length; i++) {
+                    addPoint(points[i]);
+                }
             }
 
             lastSegment = seg;
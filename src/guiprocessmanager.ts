@@ -14,6 +14,8 @@ import { time, timeEnd } from "./gui";
 import { Settings } from "./settings";
 import { Point } from "./structs/point";
 import { CLUSTERING_DEFAULTS, UPDATE_INTERVALS, SVG_CONSTANTS } from "./lib/constants";
+import { getResizedDimensions } from "./lib/imageSize";
+import { getQuadraticPathData } from "./lib/svgPath";
 
 export class ProcessResult {
     public facetResult!: FacetResult;
@@ -28,23 +30,13 @@ export class GUIProcessManager {
     public static async process(settings: Settings, cancellationToken: CancellationToken): Promise<ProcessResult> {
         const c = document.getElementById("canvas") as HTMLCanvasElement;
         const ctx = c.getContext("2d")!;
-        let imgData = ctx.getImageData(0, 0, c.width, c.height);
-
-        if (settings.resizeImageIfTooLarge && (c.width > settings.resizeImageWidth || c.height > settings.resizeImageHeight)) {
-            let width = c.width;
-            let height = c.height;
-            if (width > settings.resizeImageWidth) {
-                const newWidth = settings.resizeImageWidth;
-                const newHeight = c.height / c.width * settings.resizeImageWidth;
-                width = newWidth;
-                height = newHeight;
-            }
-            if (height > settings.resizeImageHeight) {
-                const newHeight = settings.resizeImageHeight;
-                const newWidth = width / height * newHeight;
-                width = newWidth;
-                height = newHeight;
-            }
+        // only read the pixels back once they're final, getImageData copies the entire canvas
+        let imgData: ImageData;
+
+        const resizedSize = settings.resizeImageIfTooLarge ? getResizedDimensions(c.width, c.height, settings.resizeImageWidth, settings.resizeImageHeight) : null;
+        if (resizedSize != null) {
+            const width = resizedSize.width;
+            const height = resizedSize.height;
 
             const tempCanvas = document.createElement("canvas");
             tempCanvas.width = width;
@@ -54,6 +46,8 @@ export class GUIProcessManager {
             c.height = height;
             ctx.drawImage(tempCanvas, 0, 0, width, height);
             imgData = ctx.getImageData(0, 0, c.width, c.height);
+        } else {
+            imgData = ctx.getImageData(0, 0, c.width, c.height);
         }
 
         // reset progress
@@ -301,6 +295,9 @@ export class GUIProcessManager {
         svg.setAttribute("width", sizeMultiplier * facetResult.width + "");
         svg.setAttribute("height", sizeMultiplier * facetResult.height + "");
 
+        // format the css color of each palette entry once instead of for every facet
+        const colorStrings = colorsByIndex.map((c) => `rgb(${c[0]},${c[1]},${c[2]})`);
+
         let count = 0;
         for (const f of facetResult.facets) {
 
@@ -320,20 +317,13 @@ export class GUIProcessManager {
                     }
                 }
                 if (newpath[0].x !== newpath[newpath.length - 1].x || newpath[0].y !== newpath[newpath.length - 1].y) {
-                    newpath.push(newpath[0]);
+                    newpath = newpath.concat([newpath[0]]);
                 } // close loop if necessary
 
                 // Create a path in SVG's namespace
                 // using quadratic curve absolute positions
                 const svgPath = document.createElementNS("http://www.w3.org/2000/svg", "path");
-                let data = "M ";
-                data += newpath[0].x * sizeMultiplier + " " + newpath[0].y * sizeMultiplier + " ";
-                for (let i: number = 1; i < newpath.length; i++) {
-                    const midpointX = (newpath[i].x + newpath[i - 1].x) / 2;
-                    const midpointY = (newpath[i].y + newpath[i - 1].y) / 2;
-                    data += "Q " + (midpointX * sizeMultiplier) + " " + (midpointY * sizeMultiplier) + " " + (newpath[i].x * sizeMultiplier) + " " + (newpath[i].y * sizeMultiplier) + " ";
-                    // data += "L " + (newpath[i].x * sizeMultiplier) + " " + (newpath[i].y * sizeMultiplier) + " ";
-                }
+                let data = getQuadraticPathData(newpath, sizeMultiplier);
                 data += "Z";
 
                 svgPath.setAttribute("data-facetId", f.id + "");
@@ -346,13 +336,13 @@ export class GUIProcessManager {
                     // make the border the same color as the fill color if there is no border stroke
                     // to not have gaps in between facets
                     if (fill) {
-                        svgPath.style.stroke = `rgb(${colorsByIndex[f.color][0]},${colorsByIndex[f.color][1]},${colorsByIndex[f.color][2]})`;
+                        svgPath.style.stroke = colorStrings[f.color];
                     }
                 }
                 svgPath.style.strokeWidth = strokeWidth + "px"; // Set stroke width
 
                 if (fill) {
-                    svgPath.style.fill = `rgb(${colorsByIndex[f.color][0]},${colorsByIndex[f.color][1]},${colorsByIndex[f.color][2]})`;
+                    svgPath.style.fill = colorStrings[f.color];
                 } else {
                     svgPath.style.fill = "none";
                 }
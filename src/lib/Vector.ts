@@ -46,7 +46,8 @@ export class Vector {
    * Calculate squared Euclidean distance to another vector
    *
    * Faster than distanceTo() when you only need to compare distances,
-   * as it avoids the expensive sqrt() operation.
+   * as it avoids the expensive sqrt() operation. 3-dimensional vectors
+   * (RGB/HSL/LAB colors, the clustering hot path) skip the loop entirely.
    *
    * @param other - Vector to calculate distance to
    * @returns Squared Euclidean distance between vectors
@@ -59,15 +60,73 @@ export class Vector {
    * ```
    */
   public distanceSquaredTo(other: Vector): number {
+    const values = this.values;
+    const otherValues = other.values;
+    const len = values.length;
+
+    if (len === 3) {
+      const d0 = otherValues[0] - values[0];
+      const d1 = otherValues[1] - values[1];
+      const d2 = otherValues[2] - values[2];
+      return d0 * d0 + d1 * d1 + d2 * d2;
+    }
+
     let sumSquares = 0;
-    const len = this.values.length;
     for (let i = 0; i < len; i++) {
-      const diff = other.values[i] - this.values[i];
+      const diff = otherValues[i] - values[i];
       sumSquares += diff * diff;
     }
     return sumSquares;
   }
 
+  /**
+   * Calculate squared Euclidean distances to many vectors in one call
+   *
+   * Reads this vector's values once instead of once per pair, which is what
+   * finding the nearest of a set of centroids needs.
+   *
+   * @param others - Vectors to calculate distances to
+   * @param out - Optional array to write the distances to (must hold others.length values)
+   * @returns Squared distance to each of the vectors, in the same order
+   *
+   * @example
+   * ```typescript
+   * const v = new Vector([0, 0]);
+   * const distSq = v.distancesSquaredTo([new Vector([3, 4]), new Vector([1, 0])]);
+   * // Returns Float64Array [25, 1]
+   * ```
+   */
+  public distancesSquaredTo(others: Vector[], out: Float64Array = new Float64Array(others.length)): Float64Array {
+    const values = this.values;
+    const len = values.length;
+    const othersLen = others.length;
+
+    if (len === 3) {
+      const v0 = values[0];
+      const v1 = values[1];
+      const v2 = values[2];
+      for (let o = 0; o < othersLen; o++) {
+        const otherValues = others[o].values;
+        const d0 = otherValues[0] - v0;
+        const d1 = otherValues[1] - v1;
+        const d2 = otherValues[2] - v2;
+        out[o] = d0 * d0 + d1 * d1 + d2 * d2;
+      }
+      return out;
+    }
+
+    for (let o = 0; o < othersLen; o++) {
+      const otherValues = others[o].values;
+      let sumSquares = 0;
+      for (let i = 0; i < len; i++) {
+        const diff = otherValues[i] - values[i];
+        sumSquares += diff * diff;
+      }
+      out[o] = sumSquares;
+    }
+    return out;
+  }
+
   /**
    * Calculate Euclidean distance to another vector
    *
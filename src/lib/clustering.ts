@@ -2,17 +2,35 @@
  * K-means clustering algorithm implementation
  *
  * Provides K-means clustering for color quantization and general vector clustering.
- * Uses Lloyd's algorithm with random initialization.
+ * Uses Lloyd's algorithm with random or k-means++ initialization. Point and centroid values are
+ * packed into flat typed arrays so the assignment and update steps run over
+ * contiguous memory instead of chasing one Vector object per point.
+ *
+ * With enough clusters the assignment step uses Hamerly's triangle inequality
+ * bounds to skip distance computations for points that can't change cluster.
+ * For large inputs {@link KMeans.stepMiniBatch} offers mini-batch updates
+ * (Sculley 2010) that only look at a weighted sample of the points per step.
  *
  * @module clustering
  */
 
 import { Random } from "../random";
+import { CLUSTERING_DEFAULTS } from "./constants";
 import { Vector } from "./Vector";
 
 // Re-export Vector for backward compatibility
 export { Vector } from "./Vector";
 
+/**
+ * How the initial centroids are chosen when none are provided
+ */
+export enum KMeansInitialization {
+  /** Pick k random data points */
+  Random = 0,
+  /** k-means++: pick points with probability proportional to weight * D(x)^2 */
+  PlusPlus = 1,
+}
+
 /**
  * K-means clustering algorithm
  *
@@ -49,13 +67,44 @@ export class KMeans {
   /** Sum of distances that centroids moved in last step */
   public currentDeltaDistanceDifference: number = 0;
 
+  /** Number of dimensions of the clustered vectors */
+  private dimensions: number;
+
+  /** Point values packed row-major, `dimensions` entries per point */
+  private pointValues: Float64Array;
+
+  /** Point weights, parallel to the rows of pointValues */
+  private pointWeights: Float64Array;
+
+  /** Centroid values packed row-major, refreshed at the start of each step */
+  private centroidValues: Float64Array;
+
+  /** Nearest centroid index per point from the last assignment step */
+  private labels: Int32Array;
+
+  /** Per point upper bound on the distance to its assigned centroid (Hamerly) */
+  private upperBounds: Float64Array | null = null;
+
+  /** Per point lower bound on the distance to any other centroid (Hamerly) */
+  private lowerBounds: Float64Array | null = null;
+
+  /** Centroid values the bounds were last computed against */
+  private boundCentroidValues: Float64Array | null = null;
+
+  /** Number of samples each centroid absorbed in mini-batch steps */
+  private miniBatchCounts: Float64Array | null = null;
+
+  /** Running sum of the point weights, used to sample points by weight */
+  private cumulativeWeights: Float64Array | null = null;
+
   /**
    * Create a new K-means clustering instance
    *
    * @param points - Data points to cluster
    * @param k - Number of clusters
    * @param random - Random number generator (for deterministic results)
-   * @param centroids - Optional initial centroids (if null, random initialization is used)
+   * @param centroids - Optional initial centroids (if null, they are picked from the points)
+   * @param initialization - How to pick the initial centroids when none are provided (default: random)
    *
    * @example
    * ```typescript
@@ -68,14 +117,32 @@ export class KMeans {
     private points: Vector[],
     public k: number,
     private random: Random,
-    centroids: Vector[] | null = null
+    centroids: Vector[] | null = null,
+    initialization: KMeansInitialization = KMeansInitialization.Random
   ) {
+    this.dimensions = points.length > 0 ? points[0].values.length : 0;
+    this.pointValues = new Float64Array(points.length * this.dimensions);
+    this.pointWeights = new Float64Array(points.length);
+    this.centroidValues = new Float64Array(k * this.dimensions);
+    this.labels = new Int32Array(points.length);
+
+    for (let p = 0; p < points.length; p++) {
+      const values = points[p].values;
+      const offset = p * this.dimensions;
+      for (let d = 0; d < this.dimensions; d++) {
+        this.pointValues[offset + d] = values[d];
+      }
+      this.pointWeights[p] = points[p].weight;
+    }
+
     if (centroids != null) {
       // Use provided centroids
       this.centroids = centroids;
       for (let i = 0; i < this.k; i++) {
         this.pointsPerCategory.push([]);
       }
+    } else if (initialization === KMeansInitialization.PlusPlus && points.length > 0) {
+      this.initCentroidsPlusPlus();
     } else {
       // Random initialization
       this.initCentroids();
@@ -96,6 +163,90 @@ export class KMeans {
     }
   }
 
+  /**
+   * Initialize centroids with k-means++ seeding
+   *
+   * Each next centroid is drawn with probability proportional to the point weight
+   * times its squared distance to the nearest centroid picked so far. This spreads
+   * the initial centroids out, which usually means fewer iterations and no clusters
+   * seeded on top of each other. If every remaining point already coincides with a
+   * centroid, a random point is picked instead.
+   *
+   * @private
+   */
+  private initCentroidsPlusPlus(): void {
+    const dims = this.dimensions;
+    const pointValues = this.pointValues;
+    const pointWeights = this.pointWeights;
+    const pointsLen = this.points.length;
+
+    // Squared distance of each point to its nearest chosen centroid
+    const minDistancesSquared = new Float64Array(pointsLen).fill(Number.MAX_VALUE);
+
+    let totalWeight = 0;
+    for (let p = 0; p < pointsLen; p++) {
+      totalWeight += pointWeights[p];
+    }
+
+    const scores = new Float64Array(pointsLen);
+    let chosenIndex = this.pickWeightedIndex(pointWeights, totalWeight);
+    for (let i = 0; i < this.k; i++) {
+      this.centroids.push(this.points[chosenIndex]);
+      this.pointsPerCategory.push([]);
+
+      if (i === this.k - 1) {
+        break;
+      }
+
+      // Update nearest distances with the centroid that was just picked
+      const centroidOffset = chosenIndex * dims;
+      let totalScore = 0;
+      for (let p = 0; p < pointsLen; p++) {
+        const pointOffset = p * dims;
+        let distanceSquared = 0;
+        for (let d = 0; d < dims; d++) {
+          const diff = pointValues[pointOffset + d] - pointValues[centroidOffset + d];
+          distanceSquared += diff * diff;
+        }
+        if (distanceSquared < minDistancesSquared[p]) {
+          minDistancesSquared[p] = distanceSquared;
+        }
+        scores[p] = minDistancesSquared[p] * pointWeights[p];
+        totalScore += scores[p];
+      }
+
+      chosenIndex = totalScore > 0
+        ? this.pickWeightedIndex(scores, totalScore)
+        : Math.floor(pointsLen * this.random.next());
+    }
+  }
+
+  /**
+   * Pick an index with probability proportional to its score
+   *
+   * @param scores - Non-negative score per index
+   * @param totalScore - Sum of all scores
+   * @returns The picked index
+   * @private
+   */
+  private pickWeightedIndex(scores: Float64Array, totalScore: number): number {
+    const target = this.random.next() * totalScore;
+    let cumulative = 0;
+    for (let i = 0; i < scores.length; i++) {
+      cumulative += scores[i];
+      if (target < cumulative) {
+        return i;
+      }
+    }
+    // rounding can leave the target just past the last cumulative sum
+    for (let i = scores.length - 1; i >= 0; i--) {
+      if (scores[i] > 0) {
+        return i;
+      }
+    }
+    return 0;
+  }
+
   /**
    * Perform one iteration of the K-means algorithm
    *
@@ -116,52 +267,497 @@ export class KMeans {
    * ```
    */
   public step(): void {
+    const k = this.k;
+    const dims = this.dimensions;
+    const pointValues = this.pointValues;
+    const pointWeights = this.pointWeights;
+    const centroidValues = this.centroidValues;
+    const labels = this.labels;
+
     // Clear previous assignments
-    for (let i = 0; i < this.k; i++) {
+    for (let i = 0; i < k; i++) {
       this.pointsPerCategory[i] = [];
     }
 
+    // Pack the current centroids, they may have been replaced since the last step
+    for (let c = 0; c < k; c++) {
+      const values = this.centroids[c].values;
+      const offset = c * dims;
+      for (let d = 0; d < dims; d++) {
+        centroidValues[offset + d] = values[d];
+      }
+    }
+
     // Assignment step: assign each point to nearest centroid
-    // Use squared distances to avoid expensive sqrt() calls
+    const pointsLen = this.points.length;
+    if (k >= CLUSTERING_DEFAULTS.MIN_CLUSTERS_FOR_DISTANCE_BOUNDS) {
+      this.assignWithBounds();
+    } else {
+      this.assignAll();
+    }
+
+    for (let p = 0; p < pointsLen; p++) {
+      this.pointsPerCategory[labels[p]].push(this.points[p]);
+    }
+
+    // Update step: recalculate centroids as the weighted average of their points,
+    // accumulated in point order so the result matches Vector.average()
+    const sums = new Float64Array(k * dims);
+    const weightSums = new Float64Array(k);
+    for (let p = 0; p < pointsLen; p++) {
+      const c = labels[p];
+      const weight = pointWeights[p];
+      const pointOffset = p * dims;
+      const centroidOffset = c * dims;
+      weightSums[c] += weight;
+      for (let d = 0; d < dims; d++) {
+        sums[centroidOffset + d] += weight * pointValues[pointOffset + d];
+      }
+    }
+
+    let totalDistanceMoved = 0;
+
+    for (let c = 0; c < k; c++) {
+      if (this.pointsPerCategory[c].length > 0) {
+        const weightSum = weightSums[c];
+        const values: number[] = new Array(dims);
+        for (let d = 0; d < dims; d++) {
+          values[d] = sums[c * dims + d] / weightSum;
+        }
+        const newCentroid = new Vector(values, weightSum);
+
+        // Track how much this centroid moved
+        const distanceMoved = this.centroids[c].distanceTo(newCentroid);
+        totalDistanceMoved += distanceMoved;
+
+        // Update centroid
+        this.centroids[c] = newCentroid;
+      }
+    }
+
+    this.currentDeltaDistanceDifference = totalDistanceMoved;
+    this.currentIteration++;
+  }
+
+  /**
+   * Perform one mini-batch iteration (Sculley, "Web-scale k-means clustering")
+   *
+   * Draws `batchSize` points with probability proportional to their weight,
+   * assigns them to the current centroids and then moves each centroid towards
+   * its samples with a per-centroid learning rate of 1 / (samples seen so far).
+   * Each step costs O(batchSize * k) instead of O(n * k).
+   *
+   * Only the centroids are updated, pointsPerCategory is left as is. Run a
+   * regular {@link step} afterwards to assign all points to the final centroids.
+   *
+   * @param batchSize - Number of points to sample per step
+   *
+   * @example
+   * ```typescript
+   * const kmeans = new KMeans(data, 16, random);
+   * kmeans.stepMiniBatch(4096);
+   * while (kmeans.currentDeltaDistanceDifference > 1 && kmeans.currentIteration < 100) {
+   *   kmeans.stepMiniBatch(4096);
+   * }
+   * kmeans.step(); // assign every point
+   * ```
+   */
+  public stepMiniBatch(batchSize: number): void {
+    const k = this.k;
+    const dims = this.dimensions;
+    const pointValues = this.pointValues;
+    const centroidValues = this.centroidValues;
+    const pointsLen = this.points.length;
+
+    if (this.miniBatchCounts === null || this.cumulativeWeights === null) {
+      this.miniBatchCounts = new Float64Array(k);
+      this.cumulativeWeights = new Float64Array(pointsLen);
+      let cumulative = 0;
+      for (let p = 0; p < pointsLen; p++) {
+        cumulative += this.pointWeights[p];
+        this.cumulativeWeights[p] = cumulative;
+      }
+    }
+    const counts = this.miniBatchCounts;
+    const cumulativeWeights = this.cumulativeWeights;
+    const totalWeight = pointsLen > 0 ? cumulativeWeights[pointsLen - 1] : 0;
+
+    for (let c = 0; c < k; c++) {
+      const values = this.centroids[c].values;
+      const offset = c * dims;
+      for (let d = 0; d < dims; d++) {
+        centroidValues[offset + d] = values[d];
+      }
+    }
+
+    // Sample and assign the whole batch against the same centroids first
+    const batchPoints = new Int32Array(batchSize);
+    const batchLabels = new Int32Array(batchSize);
+    for (let b = 0; b < batchSize; b++) {
+      const p = this.sampleWeightedPoint(cumulativeWeights, totalWeight);
+      const pointOffset = p * dims;
+      let minDistanceSquared = Number.MAX_VALUE;
+      let nearestCentroidIndex = 0;
+      for (let c = 0; c < k; c++) {
+        const centroidOffset = c * dims;
+        let distanceSquared = 0;
+        for (let d = 0; d < dims; d++) {
+          const diff = pointValues[pointOffset + d] - centroidValues[centroidOffset + d];
+          distanceSquared += diff * diff;
+        }
+        if (distanceSquared < minDistanceSquared) {
+          nearestCentroidIndex = c;
+          minDistanceSquared = distanceSquared;
+        }
+      }
+      batchPoints[b] = p;
+      batchLabels[b] = nearestCentroidIndex;
+    }
+
+    // Gradient step: move each centroid towards its samples with a decaying rate
+    const touched = new Uint8Array(k);
+    for (let b = 0; b < batchSize; b++) {
+      const c = batchLabels[b];
+      const pointOffset = batchPoints[b] * dims;
+      const centroidOffset = c * dims;
+      counts[c]++;
+      touched[c] = 1;
+      const learningRate = 1 / counts[c];
+      for (let d = 0; d < dims; d++) {
+        centroidValues[centroidOffset + d] += learningRate * (pointValues[pointOffset + d] - centroidValues[centroidOffset + d]);
+      }
+    }
+
+    let totalSamples = 0;
+    for (let c = 0; c < k; c++) {
+      totalSamples += counts[c];
+    }
+
+    let totalDistanceMoved = 0;
+    for (let c = 0; c < k; c++) {
+      if (touched[c] === 1) {
+        const values: number[] = new Array(dims);
+        for (let d = 0; d < dims; d++) {
+          values[d] = centroidValues[c * dims + d];
+        }
+        const newCentroid = new Vector(values, counts[c] / totalSamples);
+        totalDistanceMoved += this.centroids[c].distanceTo(newCentroid);
+        this.centroids[c] = newCentroid;
+      }
+    }
+
+    this.currentDeltaDistanceDifference = totalDistanceMoved;
+    this.currentIteration++;
+  }
+
+  /**
+   * Assign every point to its nearest current centroid without moving the centroids
+   *
+   * {@link stepMiniBatch} leaves pointsPerCategory untouched, so this fills it in
+   * when the intermediate clustering has to be shown, e.g. for a progress preview.
+   * The assignment is the same one {@link step} would make.
+   *
+   * @example
+   * ```typescript
+   * kmeans.stepMiniBatch(4096);
+   * kmeans.assignPoints();
+   * // kmeans.pointsPerCategory now reflects the current centroids
+   * ```
+   */
+  public assignPoints(): void {
+    const k = this.k;
+    const dims = this.dimensions;
+    const centroidValues = this.centroidValues;
+    const labels = this.labels;
+
+    for (let c = 0; c < k; c++) {
+      const values = this.centroids[c].values;
+      const offset = c * dims;
+      for (let d = 0; d < dims; d++) {
+        centroidValues[offset + d] = values[d];
+      }
+      this.pointsPerCategory[c] = [];
+    }
+
+    // a full scan, the distance bounds of step() are left as they are
+    this.assignAll();
+
     const pointsLen = this.points.length;
     for (let p = 0; p < pointsLen; p++) {
-      const point = this.points[p];
+      this.pointsPerCategory[labels[p]].push(this.points[p]);
+    }
+  }
+
+  /**
+   * Pick a point index with probability proportional to its weight
+   *
+   * @param cumulativeWeights - Running sum of the point weights
+   * @param totalWeight - Sum of all point weights
+   * @returns The picked point index
+   * @private
+   */
+  private sampleWeightedPoint(cumulativeWeights: Float64Array, totalWeight: number): number {
+    const target = this.random.next() * totalWeight;
+    // binary search for the first running sum past the target
+    let low = 0;
+    let high = cumulativeWeights.length - 1;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (cumulativeWeights[mid] > target) {
+        high = mid;
+      } else {
+        low = mid + 1;
+      }
+    }
+    return low;
+  }
+
+  /**
+   * Assign every point to its nearest centroid by checking all centroids
+   *
+   * Uses squared distances to avoid expensive sqrt() calls. Ties go to the
+   * centroid with the lowest index.
+   *
+   * @private
+   */
+  private assignAll(): void {
+    if (this.dimensions === 3) {
+      this.assignAll3D();
+      return;
+    }
+
+    const k = this.k;
+    const dims = this.dimensions;
+    const pointValues = this.pointValues;
+    const centroidValues = this.centroidValues;
+    const labels = this.labels;
+
+    const pointsLen = this.points.length;
+    for (let p = 0; p < pointsLen; p++) {
+      const pointOffset = p * dims;
       let minDistanceSquared = Number.MAX_VALUE;
       let nearestCentroidIndex = -1;
 
-      for (let k = 0; k < this.k; k++) {
-        const distanceSquared = this.centroids[k].distanceSquaredTo(point);
+      for (let c = 0; c < k; c++) {
+        const centroidOffset = c * dims;
+        let distanceSquared = 0;
+        for (let d = 0; d < dims; d++) {
+          const diff = pointValues[pointOffset + d] - centroidValues[centroidOffset + d];
+          distanceSquared += diff * diff;
+        }
         if (distanceSquared < minDistanceSquared) {
-          nearestCentroidIndex = k;
+          nearestCentroidIndex = c;
           minDistanceSquared = distanceSquared;
         }
       }
 
-      this.pointsPerCategory[nearestCentroidIndex].push(point);
+      labels[p] = nearestCentroidIndex;
     }
+  }
 
-    // Update step: recalculate centroids
-    let totalDistanceMoved = 0;
+  /**
+   * Same as {@link assignAll} specialized for 3 dimensions (the color case):
+   * the point stays in locals for the whole centroid loop and the distance is unrolled
+   *
+   * @private
+   */
+  private assignAll3D(): void {
+    const k = this.k;
+    const pointValues = this.pointValues;
+    const centroidValues = this.centroidValues;
+    const labels = this.labels;
 
-    const clustersLen = this.pointsPerCategory.length;
-    for (let k = 0; k < clustersLen; k++) {
-      const cluster = this.pointsPerCategory[k];
+    const pointsLen = this.points.length;
+    for (let p = 0; p < pointsLen; p++) {
+      const pointOffset = p * 3;
+      const x0 = pointValues[pointOffset];
+      const x1 = pointValues[pointOffset + 1];
+      const x2 = pointValues[pointOffset + 2];
+      let minDistanceSquared = Number.MAX_VALUE;
+      let nearestCentroidIndex = -1;
 
-      if (cluster.length > 0) {
-        // Calculate new centroid as weighted average
-        const newCentroid = Vector.average(cluster);
+      for (let c = 0, centroidOffset = 0; c < k; c++, centroidOffset += 3) {
+        const d0 = x0 - centroidValues[centroidOffset];
+        const d1 = x1 - centroidValues[centroidOffset + 1];
+        const d2 = x2 - centroidValues[centroidOffset + 2];
+        const distanceSquared = d0 * d0 + d1 * d1 + d2 * d2;
+        if (distanceSquared < minDistanceSquared) {
+          nearestCentroidIndex = c;
+          minDistanceSquared = distanceSquared;
+        }
+      }
 
-        // Track how much this centroid moved
-        const distanceMoved = this.centroids[k].distanceTo(newCentroid);
-        totalDistanceMoved += distanceMoved;
+      labels[p] = nearestCentroidIndex;
+    }
+  }
 
-        // Update centroid
-        this.centroids[k] = newCentroid;
+  /**
+   * Assign points to their nearest centroid using Hamerly's bounds
+   *
+   * Each point keeps an upper bound on the distance to its own centroid and a
+   * lower bound on the distance to every other centroid. Both are loosened by
+   * how far the centroids drifted since the last step. A point whose upper bound
+   * is strictly below the lower bound (or below half the distance from its
+   * centroid to the closest other centroid) can't have moved to another
+   * cluster and is skipped. The remaining points get a full scan, so the
+   * assignment is the same as {@link assignAll}.
+   *
+   * @private
+   */
+  private assignWithBounds(): void {
+    const k = this.k;
+    const dims = this.dimensions;
+    const pointValues = this.pointValues;
+    const centroidValues = this.centroidValues;
+    const labels = this.labels;
+    const pointsLen = this.points.length;
+
+    if (this.upperBounds === null || this.lowerBounds === null || this.boundCentroidValues === null) {
+      this.upperBounds = new Float64Array(pointsLen);
+      this.lowerBounds = new Float64Array(pointsLen);
+      this.boundCentroidValues = new Float64Array(k * dims);
+      for (let p = 0; p < pointsLen; p++) {
+        this.scanAllCentroids(p, this.upperBounds, this.lowerBounds);
       }
+      this.boundCentroidValues.set(centroidValues);
+      return;
     }
 
-    this.currentDeltaDistanceDifference = totalDistanceMoved;
-    this.currentIteration++;
+    const upperBounds = this.upperBounds;
+    const lowerBounds = this.lowerBounds;
+    const boundCentroidValues = this.boundCentroidValues;
+
+    // How far each centroid moved since the bounds were computed
+    const drift = new Float64Array(k);
+    let maxDrift = 0;
+    let maxDriftIndex = -1;
+    let secondMaxDrift = 0;
+    for (let c = 0; c < k; c++) {
+      const offset = c * dims;
+      let driftSquared = 0;
+      for (let d = 0; d < dims; d++) {
+        const diff = centroidValues[offset + d] - boundCentroidValues[offset + d];
+        driftSquared += diff * diff;
+      }
+      drift[c] = Math.sqrt(driftSquared);
+      if (drift[c] > maxDrift) {
+        secondMaxDrift = maxDrift;
+        maxDrift = drift[c];
+        maxDriftIndex = c;
+      } else if (drift[c] > secondMaxDrift) {
+        secondMaxDrift = drift[c];
+      }
+    }
+
+    // Half the distance from each centroid to its closest other centroid
+    const halfClosestCentroidDistance = new Float64Array(k).fill(Number.MAX_VALUE);
+    for (let c1 = 0; c1 < k; c1++) {
+      const offset1 = c1 * dims;
+      for (let c2 = c1 + 1; c2 < k; c2++) {
+        const offset2 = c2 * dims;
+        let distanceSquared = 0;
+        for (let d = 0; d < dims; d++) {
+          const diff = centroidValues[offset1 + d] - centroidValues[offset2 + d];
+          distanceSquared += diff * diff;
+        }
+        const halfDistance = 0.5 * Math.sqrt(distanceSquared);
+        if (halfDistance < halfClosestCentroidDistance[c1]) {
+          halfClosestCentroidDistance[c1] = halfDistance;
+        }
+        if (halfDistance < halfClosestCentroidDistance[c2]) {
+          halfClosestCentroidDistance[c2] = halfDistance;
+        }
+      }
+    }
+
+    for (let p = 0; p < pointsLen; p++) {
+      const assigned = labels[p];
+      upperBounds[p] += drift[assigned];
+      lowerBounds[p] -= assigned === maxDriftIndex ? secondMaxDrift : maxDrift;
+
+      const bound = Math.max(halfClosestCentroidDistance[assigned], lowerBounds[p]);
+      if (upperBounds[p] < bound) {
+        continue;
+      }
+
+      // Tighten the upper bound and try again before scanning all centroids
+      const pointOffset = p * dims;
+      const centroidOffset = assigned * dims;
+      let distanceSquared = 0;
+      for (let d = 0; d < dims; d++) {
+        const diff = pointValues[pointOffset + d] - centroidValues[centroidOffset + d];
+        distanceSquared += diff * diff;
+      }
+      upperBounds[p] = Math.sqrt(distanceSquared);
+      if (upperBounds[p] < bound) {
+        continue;
+      }
+
+      this.scanAllCentroids(p, upperBounds, lowerBounds);
+    }
+
+    boundCentroidValues.set(centroidValues);
+  }
+
+  /**
+   * Assign a single point by checking all centroids and reset its bounds
+   * to the nearest and second nearest centroid distance
+   *
+   * @param p - Index of the point
+   * @param upperBounds - Upper bounds to update
+   * @param lowerBounds - Lower bounds to update
+   * @private
+   */
+  private scanAllCentroids(p: number, upperBounds: Float64Array, lowerBounds: Float64Array): void {
+    const k = this.k;
+    const dims = this.dimensions;
+    const pointValues = this.pointValues;
+    const centroidValues = this.centroidValues;
+
+    const pointOffset = p * dims;
+    let minDistanceSquared = Number.MAX_VALUE;
+    let secondMinDistanceSquared = Number.MAX_VALUE;
+    let nearestCentroidIndex = -1;
+
+    if (dims === 3) {
+      // colors: keep the point in locals and unroll the distance
+      const x0 = pointValues[pointOffset];
+      const x1 = pointValues[pointOffset + 1];
+      const x2 = pointValues[pointOffset + 2];
+      for (let c = 0, centroidOffset = 0; c < k; c++, centroidOffset += 3) {
+        const d0 = x0 - centroidValues[centroidOffset];
+        const d1 = x1 - centroidValues[centroidOffset + 1];
+        const d2 = x2 - centroidValues[centroidOffset + 2];
+        const distanceSquared = d0 * d0 + d1 * d1 + d2 * d2;
+        if (distanceSquared < minDistanceSquared) {
+          secondMinDistanceSquared = minDistanceSquared;
+          nearestCentroidIndex = c;
+          minDistanceSquared = distanceSquared;
+        } else if (distanceSquared < secondMinDistanceSquared) {
+          secondMinDistanceSquared = distanceSquared;
+        }
+      }
+    } else {
+      for (let c = 0; c < k; c++) {
+        const centroidOffset = c * dims;
+        let distanceSquared = 0;
+        for (let d = 0; d < dims; d++) {
+          const diff = pointValues[pointOffset + d] - centroidValues[centroidOffset + d];
+          distanceSquared += diff * diff;
+        }
+        if (distanceSquared < minDistanceSquared) {
+          secondMinDistanceSquared = minDistanceSquared;
+          nearestCentroidIndex = c;
+          minDistanceSquared = distanceSquared;
+        } else if (distanceSquared < secondMinDistanceSquared) {
+          secondMinDistanceSquared = distanceSquared;
+        }
+      }
+    }
+
+    this.labels[p] = nearestCentroidIndex;
+    upperBounds[p] = Math.sqrt(minDistanceSquared);
+    lowerBounds[p] = Math.sqrt(secondMinDistanceSquared);
   }
 
   /**
@@ -171,14 +767,14 @@ export class KMeans {
    * @returns Index of nearest cluster (0 to k-1)
    */
   public classify(point: Vector): number {
+    const distancesSquared = point.distancesSquaredTo(this.centroids);
     let minDistanceSquared = Number.MAX_VALUE;
     let nearestIndex = 0;
 
     for (let k = 0; k < this.k; k++) {
-      const distanceSquared = this.centroids[k].distanceSquaredTo(point);
-      if (distanceSquared < minDistanceSquared) {
+      if (distancesSquared[k] < minDistanceSquared) {
         nearestIndex = k;
-        minDistanceSquared = distanceSquared;
+        minDistanceSquared = distancesSquared[k];
       }
     }
 
@@ -31,6 +31,9 @@ export const CLUSTERING_DEFAULTS = {
 
   /** Maximum delta distance for progress calculation */
   MAX_DELTA_DISTANCE_FOR_PROGRESS: 100,
+
+  /** Minimum cluster count before K-means prunes distance checks with triangle inequality bounds */
+  MIN_CLUSTERS_FOR_DISTANCE_BOUNDS: 8,
 } as const;
 
 /**
@@ -113,6 +116,9 @@ export const SEGMENTATION_CONSTANTS = {
 
   /** Number of narrow pixel strip cleanup runs */
   DEFAULT_NARROW_STRIP_CLEANUP_RUNS: 3,
+
+  /** Border tracing visits facets in Z-order of tiles of 2^n x 2^n pixels */
+  TRACE_TILE_SIZE_BITS: 4,
 } as const;
 
 /**
@@ -0,0 +1,57 @@
+/**
+ * Image size utilities
+ *
+ * Shared by the GUI and the CLI to decide whether an input image has to be
+ * scaled down before processing, and to what size.
+ *
+ * @module imageSize
+ */
+
+/**
+ * Width and height of an image
+ */
+export interface Dimensions {
+  width: number;
+  height: number;
+}
+
+/**
+ * Calculate the size an image has to be scaled down to so it fits within the maximum size
+ *
+ * The aspect ratio is preserved. The returned size may be fractional, canvases
+ * truncate it when they're created with it.
+ *
+ * @param width - Current image width
+ * @param height - Current image height
+ * @param maxWidth - Maximum allowed width
+ * @param maxHeight - Maximum allowed height
+ * @returns The scaled down size, or null if the image already fits and doesn't need resizing
+ *
+ * @example
+ * ```typescript
+ * getResizedDimensions(200, 100, 100, 100);  // Returns { width: 100, height: 50 }
+ * getResizedDimensions(80, 60, 100, 100);    // Returns null
+ * ```
+ */
+export function getResizedDimensions(
+  width: number,
+  height: number,
+  maxWidth: number,
+  maxHeight: number
+): Dimensions | null {
+  if (width <= maxWidth && height <= maxHeight) {
+    return null;
+  }
+
+  let newWidth = width;
+  let newHeight = height;
+  if (newWidth > maxWidth) {
+    newHeight = height / width * maxWidth;
+    newWidth = maxWidth;
+  }
+  if (newHeight > maxHeight) {
+    newWidth = newWidth / newHeight * maxHeight;
+    newHeight = maxHeight;
+  }
+  return { width: newWidth, height: newHeight };
+}
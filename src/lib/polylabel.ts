@@ -4,6 +4,8 @@ import { IComparable, IHeapItem, PriorityQueue } from "./datastructs";
 
 type Polygon = PolygonRing[];
 type PolygonRing = Point[];
+// rings with their coordinates stored as consecutive x,y pairs, which is what the cells are probed against
+type FlatPolygon = Float64Array[];
 
 interface Point {
     x: number;
@@ -40,18 +42,22 @@ export function polylabel(polygon: Polygon, precision: number = 1.0): PointResul
 
     if (cellSize === 0) { return { pt: { x: minX, y: minY }, distance: 0 }; }
 
+    // the distance to the polygon is calculated for every probed cell, so lay out the rings
+    // as flat coordinate arrays once instead of chasing the point objects for each probe
+    const flatPolygon = flattenPolygon(polygon);
+
     // cover polygon with initial cells
     for (let x = minX; x < maxX; x += cellSize) {
         for (let y = minY; y < maxY; y += cellSize) {
-            cellQueue.enqueue(new Cell(x + h, y + h, h, polygon));
+            cellQueue.enqueue(new Cell(x + h, y + h, h, flatPolygon));
         }
     }
 
     // take centroid as the first best guess
-    let bestCell = getCentroidCell(polygon);
+    let bestCell = getCentroidCell(polygon, flatPolygon);
 
     // special case for rectangular polygons
-    const bboxCell = new Cell(minX + width / 2, minY + height / 2, 0, polygon);
+    const bboxCell = new Cell(minX + width / 2, minY + height / 2, 0, flatPolygon);
     if (bboxCell.d > bestCell.d) { bestCell = bboxCell; }
 
     let numProbes = cellQueue.size;
@@ -70,10 +76,10 @@ export function polylabel(polygon: Polygon, precision: number = 1.0): PointResul
 
         // split the cell into four cells
         h = cell.h / 2;
-        cellQueue.enqueue(new Cell(cell.x - h, cell.y - h, h, polygon));
-        cellQueue.enqueue(new Cell(cell.x + h, cell.y - h, h, polygon));
-        cellQueue.enqueue(new Cell(cell.x - h, cell.y + h, h, polygon));
-        cellQueue.enqueue(new Cell(cell.x + h, cell.y + h, h, polygon));
+        cellQueue.enqueue(new Cell(cell.x - h, cell.y - h, h, flatPolygon));
+        cellQueue.enqueue(new Cell(cell.x + h, cell.y - h, h, flatPolygon));
+        cellQueue.enqueue(new Cell(cell.x - h, cell.y + h, h, flatPolygon));
+        cellQueue.enqueue(new Cell(cell.x + h, cell.y + h, h, flatPolygon));
         numProbes += 4;
     }
 
@@ -86,11 +92,11 @@ class Cell implements IHeapItem {
     public h: number; // half the cell size
     public d: number; // distance from cell center to polygon
     public max: number; // max distance to polygon within a cell
-    constructor(x: number, y: number, h: number, polygon: Polygon) {
+    constructor(x: number, y: number, h: number, polygon: FlatPolygon) {
         this.x = x;
         this.y = y;
         this.h = h;
-        this.d = pointToPolygonDist(x, y, polygon);
+        this.d = flatPointToPolygonDist(x, y, polygon);
         this.max = this.d + this.h * Math.SQRT2;
     }
 
@@ -154,8 +160,66 @@ export function pointToPolygonDist(x: number, y: number, polygon: Polygon): numb
     return (inside ? 1 : -1) * Math.sqrt(minDistSq);
 }
 
+function flattenPolygon(polygon: Polygon): FlatPolygon {
+    const flatPolygon: FlatPolygon = new Array(polygon.length);
+    for (let k = 0; k < polygon.length; k++) {
+        const ring = polygon[k];
+        const coords = new Float64Array(ring.length * 2);
+        for (let i = 0; i < ring.length; i++) {
+            coords[i * 2] = ring[i].x;
+            coords[i * 2 + 1] = ring[i].y;
+        }
+        flatPolygon[k] = coords;
+    }
+    return flatPolygon;
+}
+
+/**
+ * Same as pointToPolygonDist, on flattened rings and with the segment distance inlined
+ */
+function flatPointToPolygonDist(px: number, py: number, polygon: FlatPolygon): number {
+    let inside = false;
+    let minDistSq = Infinity;
+
+    for (let k = 0; k < polygon.length; k++) {
+        const coords = polygon[k];
+
+        for (let i = 0, len = coords.length, j = len - 2; i < len; j = i, i += 2) {
+            const ax = coords[i];
+            const ay = coords[i + 1];
+            const bx = coords[j];
+            const by = coords[j + 1];
+
+            if ((ay > py !== by > py) &&
+                (px < (bx - ax) * (py - ay) / (by - ay) + ax)) { inside = !inside; }
+
+            // squared distance to the segment [a-b], see getSegDistSq
+            let x = ax;
+            let y = ay;
+            let dx = bx - x;
+            let dy = by - y;
+            if (dx !== 0 || dy !== 0) {
+                const t = ((px - x) * dx + (py - y) * dy) / (dx * dx + dy * dy);
+                if (t > 1) {
+                    x = bx;
+                    y = by;
+                } else if (t > 0) {
+                    x += dx * t;
+                    y += dy * t;
+                }
+            }
+            dx = px - x;
+            dy = py - y;
+            const distSq = dx * dx + dy * dy;
+            if (distSq < minDistSq) { minDistSq = distSq; }
+        }
+    }
+
+    return (inside ? 1 : -1) * Math.sqrt(minDistSq);
+}
+
 // get polygon centroid
-function getCentroidCell(polygon: Polygon) {
+function getCentroidCell(polygon: Polygon, flatPolygon: FlatPolygon) {
     let area = 0;
     let x = 0;
     let y = 0;
@@ -169,6 +233,6 @@ function getCentroidCell(polygon: Polygon) {
         y += (a.y + b.y) * f;
         area += f * 3;
     }
-    if (area === 0) { return new Cell(points[0].x, points[0].y, 0, polygon); }
-    return new Cell(x / area, y / area, 0, polygon);
+    if (area === 0) { return new Cell(points[0].x, points[0].y, 0, flatPolygon); }
+    return new Cell(x / area, y / area, 0, flatPolygon);
 }
@@ -0,0 +1,44 @@
+/**
+ * SVG path utilities
+ *
+ * Shared by the GUI and the CLI to turn a facet border path into the data
+ * attribute of an SVG path element.
+ *
+ * @module svgPath
+ */
+
+import { Point } from '../structs/point';
+
+/**
+ * Build the SVG path data for a border path, smoothed with quadratic curves
+ *
+ * Every point becomes the end point of a quadratic curve whose control point
+ * is the midpoint between it and the previous point. All coordinates are
+ * scaled by the size multiplier. The path isn't closed with "Z", the caller
+ * decides whether it needs that.
+ *
+ * @param path - Border path points, at least one
+ * @param sizeMultiplier - Scale factor applied to all coordinates
+ * @returns The path data, ending with a trailing space
+ *
+ * @example
+ * ```typescript
+ * getQuadraticPathData([new Point(0, 0), new Point(2, 0)], 10);
+ * // Returns "M 0 0 Q 10 0 20 0 "
+ * ```
+ */
+export function getQuadraticPathData(path: Point[], sizeMultiplier: number): string {
+  let prevX = path[0].x;
+  let prevY = path[0].y;
+  let data = 'M ' + prevX * sizeMultiplier + ' ' + prevY * sizeMultiplier + ' ';
+  for (let i = 1; i < path.length; i++) {
+    const x = path[i].x;
+    const y = path[i].y;
+    const midpointX = (x + prevX) / 2;
+    const midpointY = (y + prevY) / 2;
+    data += 'Q ' + midpointX * sizeMultiplier + ' ' + midpointY * sizeMultiplier + ' ' + x * sizeMultiplier + ' ' + y * sizeMultiplier + ' ';
+    prevX = x;
+    prevY = y;
+  }
+  return data;
+}
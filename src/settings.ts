@@ -11,6 +11,8 @@ export class Settings {
     public kMeansNrOfClusters: number = CLUSTERING_DEFAULTS.DEFAULT_COLOR_COUNT;
     public kMeansMinDeltaDifference: number = CLUSTERING_DEFAULTS.CONVERGENCE_THRESHOLD;
     public kMeansClusteringColorSpace: ClusteringColorSpace = ClusteringColorSpace.RGB;
+    public kMeansPlusPlusInitialization: boolean = true;
+    public kMeansMiniBatchSize: number = 0; // 0 runs full k-means on every unique color
 
     public kMeansColorRestrictions: Array<RGB | string> = [];
 
@@ -11,4 +11,13 @@ export class BoundingBox {
     get height(): number {
         return this.maxY - this.minY + 1;
     }
+
+    /**
+     * Returns true if x,y falls within the bounds (inclusive). Works for fractional
+     * coordinates such as wall positions and is false for an empty bounding box.
+     * Uses non short-circuiting comparisons so there's no branching on the individual tests
+     */
+    public contains(x: number, y: number): boolean {
+        return ((+(x >= this.minX)) & (+(x <= this.maxX)) & (+(y >= this.minY)) & (+(y <= this.maxY))) === 1;
+    }
 }
@@ -11,6 +11,16 @@ export class Uint32Array2D {
     public set(x: number, y: number, value: number) {
         this.arr[y * this.width + x] = value;
     }
+
+    /** Sets every cell to the given value */
+    public fill(value: number) {
+        this.arr.fill(value);
+    }
+
+    /** Sets every cell in the rectangle [x, x + width) x [y, y + height), clipped to the array */
+    public fillRect(x: number, y: number, width: number, height: number, value: number) {
+        fillRect(this.arr, this.width, this.height, x, y, width, height, value);
+    }
 }
 
 export class Uint8Array2D {
@@ -26,25 +36,106 @@ export class Uint8Array2D {
         this.arr[y * this.width + x] = value;
     }
 
+    /** Sets every cell to the given value */
+    public fill(value: number) {
+        this.arr.fill(value);
+    }
+
+    /** Sets every cell in the rectangle [x, x + width) x [y, y + height), clipped to the array */
+    public fillRect(x: number, y: number, width: number, height: number, value: number) {
+        fillRect(this.arr, this.width, this.height, x, y, width, height, value);
+    }
+
+    /** Returns true if all 4 neighbours exist and have the given value, cells on the edge never match */
     public matchAllAround(x: number, y: number, value: number) {
+        if (x < 1 || y < 1 || x >= this.width - 1 || y >= this.height - 1) {
+            return false;
+        }
         const idx = y * this.width + x;
-        return (x - 1 >= 0 && this.arr[idx - 1] === value) &&
-            (y - 1 >= 0 && this.arr[idx - this.width] === value) &&
-            (x + 1 < this.width && this.arr[idx + 1] === value) &&
-            (y + 1 < this.height && this.arr[idx + this.width] === value);
+        return this.arr[idx - 1] === value &&
+            this.arr[idx + 1] === value &&
+            this.arr[idx - this.width] === value &&
+            this.arr[idx + this.width] === value;
     }
 }
 
+/**
+ * Packs 8 cells per byte, with every row starting on a byte boundary. The visited masks
+ * are as large as the image, this keeps them 8 times smaller so they stay in cache.
+ */
 export class BooleanArray2D {
     private arr: Uint8Array;
+    private bytesPerRow: number;
     constructor(private width: number, private height: number) {
-        this.arr = new Uint8Array(width * height);
+        this.bytesPerRow = (width + 7) >> 3;
+        this.arr = new Uint8Array(this.bytesPerRow * height);
     }
 
     public get(x: number, y: number) {
-        return this.arr[y * this.width + x] !== 0;
+        return ((this.arr[y * this.bytesPerRow + (x >> 3)] >> (x & 7)) & 1) !== 0;
     }
     public set(x: number, y: number, value: boolean) {
-        this.arr[y * this.width + x] = value ? 1 : 0;
+        const idx = y * this.bytesPerRow + (x >> 3);
+        if (value) {
+            this.arr[idx] |= 1 << (x & 7);
+        } else {
+            this.arr[idx] &= ~(1 << (x & 7));
+        }
+    }
+
+    /** Sets every cell to the given value */
+    public fill(value: boolean) {
+        this.arr.fill(value ? 0xFF : 0);
+    }
+
+    /** Sets every cell in the rectangle [x, x + width) x [y, y + height), clipped to the array */
+    public fillRect(x: number, y: number, width: number, height: number, value: boolean) {
+        const startX = Math.max(x, 0);
+        const endX = Math.min(x + width, this.width);
+        const startY = Math.max(y, 0);
+        const endY = Math.min(y + height, this.height);
+        if (startX >= endX) {
+            return;
+        }
+        // partial bytes at either end of the row span are masked, whole bytes in between are filled natively
+        const startByte = startX >> 3;
+        const lastByte = (endX - 1) >> 3;
+        const startMask = (0xFF << (startX & 7)) & 0xFF;
+        const endMask = 0xFF >> (7 - ((endX - 1) & 7));
+        for (let j = startY; j < endY; j++) {
+            const offset = j * this.bytesPerRow;
+            if (startByte === lastByte) {
+                this.setBits(offset + startByte, startMask & endMask, value);
+            } else {
+                this.setBits(offset + startByte, startMask, value);
+                this.arr.fill(value ? 0xFF : 0, offset + startByte + 1, offset + lastByte);
+                this.setBits(offset + lastByte, endMask, value);
+            }
+        }
+    }
+
+    private setBits(idx: number, mask: number, value: boolean) {
+        if (value) {
+            this.arr[idx] |= mask;
+        } else {
+            this.arr[idx] &= ~mask;
+        }
+    }
+}
+
+/**
+ * Fills a rectangle of a row-major 2D array one row at a time with the native fill
+ */
+function fillRect(arr: Uint8Array | Uint32Array, arrWidth: number, arrHeight: number, x: number, y: number, width: number, height: number, value: number) {
+    const startX = Math.max(x, 0);
+    const endX = Math.min(x + width, arrWidth);
+    const startY = Math.max(y, 0);
+    const endY = Math.min(y + height, arrHeight);
+    if (startX >= endX) {
+        return;
+    }
+    for (let j = startY; j < endY; j++) {
+        const offset = j * arrWidth;
+        arr.fill(value, offset + startX, offset + endX);
     }
 }
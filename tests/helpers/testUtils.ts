@@ -8,6 +8,7 @@
 
 import * as fs from 'fs';
 import * as path from 'path';
+import { Uint8Array2D } from '../../src/structs/typedarrays';
 
 /**
  * Load a test image from the fixtures directory
@@ -153,6 +154,67 @@ export function createFilledImageData(
   };
 }
 
+/**
+ * Create a color index map split into two regions
+ *
+ * Pixels left of `splitX` (or above `splitY` when given) get color 0, the rest color 1.
+ * The regions are written with row fills instead of per-pixel set() calls.
+ *
+ * @param width - Width of the map
+ * @param height - Height of the map
+ * @param splitX - First column of the second region
+ * @param splitY - First row of the second region, splits horizontally instead when given
+ * @returns Color index map with two regions
+ *
+ * @example
+ * const colorMap = createSplitColorMap(10, 10, 5);
+ * expect(colorMap.get(4, 0)).toBe(0);
+ * expect(colorMap.get(5, 0)).toBe(1);
+ */
+export function createSplitColorMap(
+  width: number,
+  height: number,
+  splitX: number,
+  splitY?: number
+): Uint8Array2D {
+  const colorMap = new Uint8Array2D(width, height);
+  if (typeof splitY === 'number') {
+    colorMap.fillRect(0, splitY, width, height - splitY, 1);
+  } else {
+    colorMap.fillRect(splitX, 0, width - splitX, height, 1);
+  }
+  return colorMap;
+}
+
+/**
+ * Create a color index map from a per-pixel pattern
+ *
+ * Pixels are written row by row, matching the memory layout, so patterns that
+ * aren't rectangles don't need their own nested loops in every test.
+ *
+ * @param width - Width of the map
+ * @param height - Height of the map
+ * @param colorAt - Color index for the pixel at x, y
+ * @returns Color index map with the pattern applied
+ *
+ * @example
+ * const checkerboard = createPatternColorMap(5, 5, (x, y) => (x + y) % 2);
+ * expect(checkerboard.get(1, 0)).toBe(1);
+ */
+export function createPatternColorMap(
+  width: number,
+  height: number,
+  colorAt: (x: number, y: number) => number
+): Uint8Array2D {
+  const colorMap = new Uint8Array2D(width, height);
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      colorMap.set(x, y, colorAt(x, y));
+    }
+  }
+  return colorMap;
+}
+
 /**
  * Verify that a file exists
  *
@@ -0,0 +1,141 @@
+/**
+ * Pipeline Benchmarks
+ *
+ * Times every stage of the processing pipeline on a synthetic image that's generated
+ * in memory, so no fixtures or canvas are needed. Each stage is warmed up first and
+ * then repeated, and the min and median are reported, which are far less noisy than a
+ * single run.
+ *
+ * Benchmarks are slow and their timings aren't assertions, so they only run when
+ * RUN_BENCHMARKS is set:
+ *
+ *   RUN_BENCHMARKS=1 npm test -- tests/performance
+ */
+
+import { performance } from 'perf_hooks';
+import { ColorReducer } from '../../src/colorreductionmanagement';
+import { FacetBorderSegmenter } from '../../src/facetBorderSegmenter';
+import { FacetBorderTracer } from '../../src/facetBorderTracer';
+import { FacetCreator } from '../../src/facetCreator';
+import { FacetLabelPlacer } from '../../src/facetLabelPlacer';
+import { FacetResult } from '../../src/facetmanagement';
+import { FacetReducer } from '../../src/facetReducer';
+import { Random } from '../../src/random';
+import { Settings } from '../../src/settings';
+
+const WARMUP_RUNS = 1;
+const MEASURED_RUNS = 5;
+
+const describeBenchmark = process.env.RUN_BENCHMARKS ? describe : describe.skip;
+
+interface StageTimings {
+  [stage: string]: number[];
+}
+
+/**
+ * Create an image of randomly colored blocks with a gradient and a bit of noise,
+ * so clustering and facet reduction both have work to do
+ */
+function createSyntheticImage(width: number, height: number, seed: number): ImageData {
+  const random = new Random(seed);
+  const blockSize = 12;
+  const blocksX = Math.ceil(width / blockSize);
+  const blocksY = Math.ceil(height / blockSize);
+  const blockColors: number[][] = [];
+  for (let i = 0; i < blocksX * blocksY; i++) {
+    blockColors.push([random.next() * 255, random.next() * 255, random.next() * 255]);
+  }
+
+  const data = new Uint8ClampedArray(width * height * 4);
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      const color = blockColors[Math.floor(y / blockSize) * blocksX + Math.floor(x / blockSize)];
+      const shade = (x + y) / (width + height) * 40;
+      const idx = (y * width + x) * 4;
+      data[idx] = color[0] + shade + random.next() * 8;
+      data[idx + 1] = color[1] + shade + random.next() * 8;
+      data[idx + 2] = color[2] + random.next() * 8;
+      data[idx + 3] = 255;
+    }
+  }
+  return { width, height, data } as ImageData;
+}
+
+/**
+ * Run the full pipeline once, adding the time of each stage to the timings
+ */
+async function runPipeline(imgData: ImageData, settings: Settings, timings: StageTimings): Promise<FacetResult> {
+  let start = performance.now();
+  const lap = (stage: string) => {
+    const now = performance.now();
+    (timings[stage] = timings[stage] || []).push(now - start);
+    start = now;
+  };
+
+  const kmeansImgData = {
+    width: imgData.width,
+    height: imgData.height,
+    data: new Uint8ClampedArray(imgData.data.length),
+  } as ImageData;
+  await ColorReducer.applyKMeansClustering(imgData, kmeansImgData, null as any, settings);
+  lap('clustering');
+
+  const colormapResult = ColorReducer.createColorMap(kmeansImgData);
+  lap('colorMap');
+
+  let facetResult = new FacetResult();
+  for (let run = 0; run < settings.narrowPixelStripCleanupRuns; run++) {
+    await ColorReducer.processNarrowPixelStripCleanup(colormapResult);
+    facetResult = await FacetCreator.getFacets(imgData.width, imgData.height, colormapResult.imgColorIndices);
+    await FacetReducer.reduceFacets(settings.removeFacetsSmallerThanNrOfPoints, settings.removeFacetsFromLargeToSmall, settings.maximumNumberOfFacets, colormapResult.colorsByIndex, facetResult, colormapResult.imgColorIndices);
+  }
+  lap('facetCreationAndReduction');
+
+  await FacetBorderTracer.buildFacetBorderPaths(facetResult);
+  lap('borderTracing');
+
+  await FacetBorderSegmenter.buildFacetBorderSegments(facetResult, settings.nrOfTimesToHalveBorderSegments);
+  lap('borderSegmentation');
+
+  await FacetLabelPlacer.buildFacetLabelBounds(facetResult);
+  lap('labelPlacement');
+
+  return facetResult;
+}
+
+function median(values: number[]): number {
+  const sorted = values.slice().sort((a, b) => a - b);
+  const mid = Math.floor(sorted.length / 2);
+  return sorted.length % 2 === 1 ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+}
+
+describeBenchmark('Pipeline benchmarks', () => {
+  const sizes = [
+    { name: 'small', width: 150, height: 150 },
+    { name: 'medium', width: 400, height: 300 },
+  ];
+
+  sizes.forEach(({ name, width, height }) => {
+    it(`should benchmark the ${name} synthetic image (${width}x${height})`, async () => {
+      const imgData = createSyntheticImage(width, height, 1234);
+      const settings = new Settings();
+      settings.randomSeed = 7707;
+
+      for (let i = 0; i < WARMUP_RUNS; i++) {
+        await runPipeline(imgData, settings, {});
+      }
+
+      const timings: StageTimings = {};
+      let facetResult: FacetResult | null = null;
+      for (let i = 0; i < MEASURED_RUNS; i++) {
+        facetResult = await runPipeline(imgData, settings, timings);
+      }
+
+      const lines = Object.keys(timings).map((stage) =>
+        `  ${stage}: min ${Math.min(...timings[stage]).toFixed(1)}ms, median ${median(timings[stage]).toFixed(1)}ms`);
+      console.log(`${name} (${width}x${height}, ${MEASURED_RUNS} runs):\n${lines.join('\n')}`);
+
+      expect(facetResult!.facets.some((f) => f != null)).toBe(true);
+    }, 300000);
+  });
+});
@@ -1,6 +1,41 @@
 import { Color } from '../../../src/lib/Color';
 import { ColorSpace } from '../../../src/lib/constants';
 
+/**
+ * Reference conversions shared by the toHSL/toLAB tests.
+ * HSL components are in 0-1, LAB uses the D65 white point.
+ */
+interface ConversionCase {
+  rgb: [number, number, number];
+  hsl: [number, number, number];
+  lab: [number, number, number];
+}
+
+const KNOWN_CONVERSIONS: ConversionCase[] = [
+  { rgb: [255, 0, 0], hsl: [0, 1, 0.5], lab: [53.233, 80.109, 67.22] },
+  { rgb: [0, 255, 0], hsl: [1 / 3, 1, 0.5], lab: [87.737, -86.185, 83.181] },
+  { rgb: [0, 0, 255], hsl: [2 / 3, 1, 0.5], lab: [32.303, 79.197, -107.864] },
+  { rgb: [0, 0, 0], hsl: [0, 0, 0], lab: [0, 0, 0] },
+  { rgb: [255, 255, 255], hsl: [0, 0, 1], lab: [100, 0, 0] },
+];
+
+/**
+ * Colors pushed through every round-trip conversion
+ */
+const ROUND_TRIP_COLORS: Array<[number, number, number]> = [
+  [255, 0, 0],
+  [0, 255, 0],
+  [0, 0, 255],
+  [0, 0, 0],
+  [255, 255, 255],
+  [128, 64, 192],
+  [128, 64, 32],
+  [200, 150, 100],
+  [50, 100, 150],
+  [255, 128, 0],
+  [100, 100, 100],
+];
+
 describe('Color', () => {
   describe('fromRGB', () => {
     it('should create color from RGB values', () => {
@@ -135,6 +170,13 @@ describe('Color', () => {
       expect(hsl.s).toBeCloseTo(0, 2);
       expect(hsl.l).toBeCloseTo(0, 2);
     });
+
+    it.each(KNOWN_CONVERSIONS)('should match reference HSL for RGB($rgb)', ({ rgb, hsl }: ConversionCase) => {
+      const actual = Color.fromRGB(rgb[0], rgb[1], rgb[2]).toHSL();
+      expect(actual.h).toBeCloseTo(hsl[0], 2);
+      expect(actual.s).toBeCloseTo(hsl[1], 2);
+      expect(actual.l).toBeCloseTo(hsl[2], 2);
+    });
   });
 
   describe('toLAB', () => {
@@ -147,6 +189,13 @@ describe('Color', () => {
       expect(Math.abs(lab.a)).toBeLessThan(5);
       expect(Math.abs(lab.b)).toBeLessThan(5);
     });
+
+    it.each(KNOWN_CONVERSIONS)('should match reference LAB for RGB($rgb)', ({ rgb, lab }: ConversionCase) => {
+      const actual = Color.fromRGB(rgb[0], rgb[1], rgb[2]).toLAB();
+      expect(actual.l).toBeCloseTo(lab[0], 1);
+      expect(actual.a).toBeCloseTo(lab[1], 1);
+      expect(actual.b).toBeCloseTo(lab[2], 1);
+    });
   });
 
   describe('distanceRGB', () => {
@@ -310,24 +359,24 @@ describe('Color', () => {
   });
 
   describe('Round-trip conversions', () => {
-    it('should preserve RGB through HSL conversion', () => {
-      const original = Color.fromRGB(128, 64, 192);
+    it.each(ROUND_TRIP_COLORS)('should preserve RGB(%s, %s, %s) through HSL conversion', (r: number, g: number, b: number) => {
+      const original = Color.fromRGB(r, g, b);
       const hsl = original.toHSL();
       const converted = Color.fromHSL(hsl.h, hsl.s, hsl.l);
 
       expect(converted.equals(original, 1)).toBe(true);
     });
 
-    it('should preserve RGB through LAB conversion', () => {
-      const original = Color.fromRGB(128, 64, 192);
+    it.each(ROUND_TRIP_COLORS)('should preserve RGB(%s, %s, %s) through LAB conversion', (r: number, g: number, b: number) => {
+      const original = Color.fromRGB(r, g, b);
       const lab = original.toLAB();
       const converted = Color.fromLAB(lab.l, lab.a, lab.b);
 
       expect(converted.equals(original, 2)).toBe(true);
     });
 
-    it('should preserve through hex conversion', () => {
-      const original = Color.fromRGB(128, 64, 192);
+    it.each(ROUND_TRIP_COLORS)('should preserve RGB(%s, %s, %s) through hex conversion', (r: number, g: number, b: number) => {
+      const original = Color.fromRGB(r, g, b);
       const hex = original.toHex();
       const converted = Color.fromHex(hex);
 
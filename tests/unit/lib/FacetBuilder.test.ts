@@ -3,13 +3,11 @@ import { Point } from '../../../src/structs/point';
 import { BoundingBox } from '../../../src/structs/boundingbox';
 import { FacetResult, Facet } from '../../../src/facetmanagement';
 import { BooleanArray2D, Uint8Array2D, Uint32Array2D } from '../../../src/structs/typedarrays';
+import { createPatternColorMap, createSplitColorMap } from '../../helpers/testUtils';
 
 describe('FacetBuilder', () => {
-  let builder: FacetBuilder;
-
-  beforeEach(() => {
-    builder = new FacetBuilder();
-  });
+  // FacetBuilder keeps no state between calls, so all tests share one instance
+  const builder = new FacetBuilder();
 
   describe('calculateBoundingBox', () => {
     it('should calculate bounding box for simple points', () => {
@@ -229,11 +227,7 @@ describe('FacetBuilder', () => {
       const visited = new BooleanArray2D(width, height);
 
       // Create a 3x3 square of color 1
-      for (let y = 4; y <= 6; y++) {
-        for (let x = 4; x <= 6; x++) {
-          colorMap.set(x, y, 1);
-        }
-      }
+      colorMap.fillRect(4, 4, 3, 3, 1);
 
       const facetResult = new FacetResult();
       facetResult.width = width;
@@ -260,9 +254,7 @@ describe('FacetBuilder', () => {
       const visited = new BooleanArray2D(width, height);
 
       // Create horizontal line of color 1
-      for (let x = 0; x < 5; x++) {
-        colorMap.set(x, 2, 1);
-      }
+      colorMap.fillRect(0, 2, 5, 1, 1);
 
       const facetResult = new FacetResult();
       facetResult.width = width;
@@ -289,10 +281,7 @@ describe('FacetBuilder', () => {
       const visited = new BooleanArray2D(width, height);
 
       // Create 2x2 square
-      colorMap.set(1, 1, 1);
-      colorMap.set(2, 1, 1);
-      colorMap.set(1, 2, 1);
-      colorMap.set(2, 2, 1);
+      colorMap.fillRect(1, 1, 2, 2, 1);
 
       const facetResult = new FacetResult();
       facetResult.width = width;
@@ -316,12 +305,8 @@ describe('FacetBuilder', () => {
       const visited = new BooleanArray2D(width, height);
 
       // Create L-shape
-      for (let x = 3; x <= 5; x++) {
-        colorMap.set(x, 5, 1); // Horizontal part
-      }
-      for (let y = 5; y <= 7; y++) {
-        colorMap.set(3, y, 1); // Vertical part
-      }
+      colorMap.fillRect(3, 5, 3, 1, 1); // Horizontal part
+      colorMap.fillRect(3, 5, 1, 3, 1); // Vertical part
 
       const facetResult = new FacetResult();
       facetResult.width = width;
@@ -344,18 +329,10 @@ describe('FacetBuilder', () => {
 
       // Create two regions
       // Region 1: top-left 3x3 with color 1
-      for (let y = 0; y < 3; y++) {
-        for (let x = 0; x < 3; x++) {
-          colorMap.set(x, y, 1);
-        }
-      }
+      colorMap.fillRect(0, 0, 3, 3, 1);
 
       // Region 2: bottom-right 3x3 with color 2
-      for (let y = 7; y < 10; y++) {
-        for (let x = 7; x < 10; x++) {
-          colorMap.set(x, y, 2);
-        }
-      }
+      colorMap.fillRect(7, 7, 3, 3, 2);
 
       // Rest is color 0
       // (already 0 by default)
@@ -389,14 +366,8 @@ describe('FacetBuilder', () => {
     it('should assign unique IDs to facets', () => {
       const width = 5;
       const height = 5;
-      const colorMap = new Uint8Array2D(width, height);
-
       // Create checkerboard pattern
-      for (let y = 0; y < height; y++) {
-        for (let x = 0; x < width; x++) {
-          colorMap.set(x, y, (x + y) % 2);
-        }
-      }
+      const colorMap = createPatternColorMap(width, height, (x, y) => (x + y) % 2);
 
       const facetResult = new FacetResult();
       facetResult.width = width;
@@ -441,14 +412,8 @@ describe('FacetBuilder', () => {
     it('should handle image with many small facets', () => {
       const width = 10;
       const height = 10;
-      const colorMap = new Uint8Array2D(width, height);
-
       // Each pixel different "color" (actually just pixel index)
-      for (let y = 0; y < height; y++) {
-        for (let x = 0; x < width; x++) {
-          colorMap.set(x, y, y * width + x);
-        }
-      }
+      const colorMap = createPatternColorMap(width, height, (x, y) => y * width + x);
 
       const facetResult = new FacetResult();
       facetResult.width = width;
@@ -470,19 +435,9 @@ describe('FacetBuilder', () => {
     it('should populate facet map correctly', () => {
       const width = 10;
       const height = 10;
-      const colorMap = new Uint8Array2D(width, height);
 
-      // Create simple two-region image
-      for (let x = 0; x < 5; x++) {
-        for (let y = 0; y < 10; y++) {
-          colorMap.set(x, y, 0); // Left half color 0
-        }
-      }
-      for (let x = 5; x < 10; x++) {
-        for (let y = 0; y < 10; y++) {
-          colorMap.set(x, y, 1); // Right half color 1
-        }
-      }
+      // Create simple two-region image: left half color 0, right half color 1
+      const colorMap = createSplitColorMap(width, height, 5);
 
       const facetResult = new FacetResult();
       facetResult.width = width;
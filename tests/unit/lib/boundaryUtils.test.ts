@@ -241,62 +241,17 @@ describe('boundaryUtils', () => {
       expect(getEdgeType(5, 5, 10, 10)).toBe(EdgeType.None);
     });
 
-    it('should return Left for left edge', () => {
-      const edge = getEdgeType(0, 5, 10, 10);
-      expect(edge & EdgeType.Left).toBeTruthy();
-      expect(edge & EdgeType.Right).toBeFalsy();
-      expect(edge & EdgeType.Top).toBeFalsy();
-      expect(edge & EdgeType.Bottom).toBeFalsy();
-    });
-
-    it('should return Right for right edge', () => {
-      const edge = getEdgeType(9, 5, 10, 10);
-      expect(edge & EdgeType.Right).toBeTruthy();
-      expect(edge & EdgeType.Left).toBeFalsy();
-    });
-
-    it('should return Top for top edge', () => {
-      const edge = getEdgeType(5, 0, 10, 10);
-      expect(edge & EdgeType.Top).toBeTruthy();
-      expect(edge & EdgeType.Bottom).toBeFalsy();
-    });
-
-    it('should return Bottom for bottom edge', () => {
-      const edge = getEdgeType(5, 9, 10, 10);
-      expect(edge & EdgeType.Bottom).toBeTruthy();
-      expect(edge & EdgeType.Top).toBeFalsy();
-    });
-
-    it('should return Top|Left for top-left corner', () => {
-      const edge = getEdgeType(0, 0, 10, 10);
-      expect(edge & EdgeType.Top).toBeTruthy();
-      expect(edge & EdgeType.Left).toBeTruthy();
-      expect(edge & EdgeType.Right).toBeFalsy();
-      expect(edge & EdgeType.Bottom).toBeFalsy();
-    });
-
-    it('should return Top|Right for top-right corner', () => {
-      const edge = getEdgeType(9, 0, 10, 10);
-      expect(edge & EdgeType.Top).toBeTruthy();
-      expect(edge & EdgeType.Right).toBeTruthy();
-      expect(edge & EdgeType.Left).toBeFalsy();
-      expect(edge & EdgeType.Bottom).toBeFalsy();
-    });
-
-    it('should return Bottom|Left for bottom-left corner', () => {
-      const edge = getEdgeType(0, 9, 10, 10);
-      expect(edge & EdgeType.Bottom).toBeTruthy();
-      expect(edge & EdgeType.Left).toBeTruthy();
-      expect(edge & EdgeType.Right).toBeFalsy();
-      expect(edge & EdgeType.Top).toBeFalsy();
-    });
-
-    it('should return Bottom|Right for bottom-right corner', () => {
-      const edge = getEdgeType(9, 9, 10, 10);
-      expect(edge & EdgeType.Bottom).toBeTruthy();
-      expect(edge & EdgeType.Right).toBeTruthy();
-      expect(edge & EdgeType.Left).toBeFalsy();
-      expect(edge & EdgeType.Top).toBeFalsy();
+    it.each([
+      ['Left for left edge', 0, 5, EdgeType.Left],
+      ['Right for right edge', 9, 5, EdgeType.Right],
+      ['Top for top edge', 5, 0, EdgeType.Top],
+      ['Bottom for bottom edge', 5, 9, EdgeType.Bottom],
+      ['Top|Left for top-left corner', 0, 0, EdgeType.Top | EdgeType.Left],
+      ['Top|Right for top-right corner', 9, 0, EdgeType.Top | EdgeType.Right],
+      ['Bottom|Left for bottom-left corner', 0, 9, EdgeType.Bottom | EdgeType.Left],
+      ['Bottom|Right for bottom-right corner', 9, 9, EdgeType.Bottom | EdgeType.Right],
+    ])('should return %s', (_name: string, x: number, y: number, expected: number) => {
+      expect(getEdgeType(x, y, 10, 10)).toBe(expected);
     });
 
     it('should handle 1x1 image (all edges)', () => {
@@ -1,5 +1,7 @@
-import { Vector, KMeans } from '../../../src/lib/clustering';
+import { Vector, KMeans, KMeansInitialization } from '../../../src/lib/clustering';
 import { Random } from '../../../src/random';
+import { ColorReducer } from '../../../src/colorreductionmanagement';
+import { Settings } from '../../../src/settings';
 
 describe('Vector', () => {
   describe('constructor', () => {
@@ -42,6 +44,44 @@ describe('Vector', () => {
     });
   });
 
+  describe('distanceSquaredTo', () => {
+    it('should match the general case for 3-dimensional vectors', () => {
+      const v1 = new Vector([10, 20, 30]);
+      const v2 = new Vector([13, 16, 30]);
+      expect(v1.distanceSquaredTo(v2)).toBe(25);
+      expect(v2.distanceSquaredTo(v1)).toBe(25);
+    });
+
+    it('should work in other dimensions', () => {
+      expect(new Vector([0, 0]).distanceSquaredTo(new Vector([3, 4]))).toBe(25);
+      expect(new Vector([1, 1, 1, 1]).distanceSquaredTo(new Vector([2, 2, 2, 2]))).toBe(4);
+    });
+  });
+
+  describe('distancesSquaredTo', () => {
+    it('should return the squared distance to each vector in order', () => {
+      const v = new Vector([0, 0, 0]);
+      const others = [new Vector([1, 2, 2]), new Vector([0, 0, 0]), new Vector([3, 0, 4])];
+      expect(Array.from(v.distancesSquaredTo(others))).toEqual([9, 0, 25]);
+    });
+
+    it('should match distanceSquaredTo in other dimensions', () => {
+      const v = new Vector([1, 2]);
+      const others = [new Vector([4, 6]), new Vector([1, 1])];
+      const distances = v.distancesSquaredTo(others);
+      expect(distances[0]).toBe(v.distanceSquaredTo(others[0]));
+      expect(distances[1]).toBe(v.distanceSquaredTo(others[1]));
+    });
+
+    it('should write into the given output array', () => {
+      const out = new Float64Array(2);
+      const result = new Vector([0, 0]).distancesSquaredTo([new Vector([3, 4]), new Vector([0, 1])], out);
+      expect(result).toBe(out);
+      expect(out[0]).toBe(25);
+      expect(out[1]).toBe(1);
+    });
+  });
+
   describe('average', () => {
     it('should calculate simple average', () => {
       const v1 = new Vector([0, 0]);
@@ -135,6 +175,28 @@ describe('KMeans', () => {
       expect(kmeans.currentIteration).toBe(0);
     });
 
+    it('should spread k-means++ centroids over separated groups', () => {
+      const points = [
+        new Vector([0, 0]),
+        new Vector([1, 1]),
+        new Vector([100, 100]),
+        new Vector([101, 101]),
+      ];
+      const kmeans = new KMeans(points, 2, random, null, KMeansInitialization.PlusPlus);
+
+      expect(kmeans.centroids).toHaveLength(2);
+      expect(kmeans.centroids[0].distanceTo(kmeans.centroids[1])).toBeGreaterThan(50);
+    });
+
+    it('should still pick k centroids with k-means++ on identical points', () => {
+      const points = [new Vector([5, 5]), new Vector([5, 5]), new Vector([5, 5])];
+      const kmeans = new KMeans(points, 2, random, null, KMeansInitialization.PlusPlus);
+
+      expect(kmeans.centroids).toHaveLength(2);
+      kmeans.step();
+      expect(kmeans.pointsPerCategory[0]).toHaveLength(3);
+    });
+
     it('should use provided centroids', () => {
       const points = [new Vector([0, 0]), new Vector([10, 10])];
       const centroids = [new Vector([1, 1]), new Vector([9, 9])];
@@ -187,6 +249,87 @@ describe('KMeans', () => {
     });
   });
 
+  describe('distance bounds', () => {
+    it('should assign the same clusters as a full scan when pruning with bounds', () => {
+      const rnd = new Random(7);
+      const points: Vector[] = [];
+      for (let i = 0; i < 300; i++) {
+        points.push(new Vector([
+          Math.floor(rnd.next() * 16) * 16,
+          Math.floor(rnd.next() * 16) * 16,
+          Math.floor(rnd.next() * 16) * 16,
+        ]));
+      }
+
+      const kmeans = new KMeans(points, 12, new Random(42));
+      for (let i = 0; i < 10; i++) {
+        const reference = new KMeans([], 12, random, kmeans.centroids.map(c => c.clone()));
+        kmeans.step();
+
+        kmeans.pointsPerCategory.forEach((cluster, k) => {
+          for (const point of cluster) {
+            expect(reference.classify(point)).toBe(k);
+          }
+        });
+      }
+    });
+  });
+
+  describe('stepMiniBatch', () => {
+    it('should move centroids towards the sampled groups without assigning points', () => {
+      const points = [
+        new Vector([0, 0], 0.25),
+        new Vector([2, 2], 0.25),
+        new Vector([100, 100], 0.25),
+        new Vector([102, 102], 0.25),
+      ];
+      const centroids = [new Vector([10, 10]), new Vector([90, 90])];
+      const kmeans = new KMeans(points, 2, new Random(7), centroids);
+
+      for (let i = 0; i < 20; i++) {
+        kmeans.stepMiniBatch(16);
+      }
+
+      expect(kmeans.currentIteration).toBe(20);
+      expect(kmeans.pointsPerCategory[0]).toHaveLength(0);
+      expect(kmeans.centroids[0].distanceTo(new Vector([1, 1]))).toBeLessThan(1.5);
+      expect(kmeans.centroids[1].distanceTo(new Vector([101, 101]))).toBeLessThan(1.5);
+
+      kmeans.step();
+      expect(kmeans.pointsPerCategory[0]).toHaveLength(2);
+      expect(kmeans.pointsPerCategory[1]).toHaveLength(2);
+    });
+
+    it('should never sample points without weight', () => {
+      const points = [new Vector([0, 0], 0), new Vector([50, 50], 1)];
+      const kmeans = new KMeans(points, 1, new Random(3), [new Vector([10, 10])]);
+
+      kmeans.stepMiniBatch(8);
+
+      expect(kmeans.centroids[0].values).toEqual([50, 50]);
+    });
+  });
+
+  describe('assignPoints', () => {
+    it('should assign all points to the nearest centroid without moving the centroids', () => {
+      const points = [
+        new Vector([0, 0], 0.25),
+        new Vector([2, 2], 0.25),
+        new Vector([100, 100], 0.25),
+        new Vector([102, 102], 0.25),
+      ];
+      const kmeans = new KMeans(points, 2, new Random(7), [new Vector([10, 10]), new Vector([90, 90])]);
+      kmeans.stepMiniBatch(16);
+      const centroidValues = kmeans.centroids.map((c) => c.values.slice());
+
+      kmeans.assignPoints();
+
+      expect(kmeans.pointsPerCategory[0]).toEqual([points[0], points[1]]);
+      expect(kmeans.pointsPerCategory[1]).toEqual([points[2], points[3]]);
+      expect(kmeans.centroids.map((c) => c.values)).toEqual(centroidValues);
+    });
+  });
+
   describe('classify', () => {
     it('should return nearest cluster index', () => {
       const centroids = [new Vector([0, 0]), new Vector([10, 10])];
@@ -253,3 +396,48 @@ describe('KMeans', () => {
     });
   });
 });
+
+describe('ColorReducer.applyKMeansClustering', () => {
+  it('should pass a filled in preview to the progress callback in mini-batch mode', async () => {
+    const width = 32;
+    const height = 32;
+    const random = new Random(11);
+    const imgData = { width, height, data: new Uint8ClampedArray(width * height * 4) } as ImageData;
+    for (let i = 0; i < imgData.data.length; i += 4) {
+      // dark colors only, so no centroid ends up as the white the output starts with
+      imgData.data[i] = random.next() * 128;
+      imgData.data[i + 1] = random.next() * 128;
+      imgData.data[i + 2] = random.next() * 128;
+      imgData.data[i + 3] = 255;
+    }
+    const outputImgData = { width, height, data: new Uint8ClampedArray(width * height * 4).fill(255) } as ImageData;
+
+    const settings = new Settings();
+    settings.randomSeed = 7707;
+    settings.kMeansNrOfClusters = 4;
+    settings.kMeansMiniBatchSize = 64;
+    settings.kMeansMinDeltaDifference = 0;
+
+    // let every iteration count as past the progress interval
+    let now = 0;
+    const getTimeSpy = jest.spyOn(Date.prototype, 'getTime').mockImplementation(() => (now += 1000));
+    const unassignedPixelsPerUpdate: number[] = [];
+    try {
+      await ColorReducer.applyKMeansClustering(imgData, outputImgData, null as any, settings, () => {
+        let unassigned = 0;
+        for (let i = 0; i < outputImgData.data.length; i += 4) {
+          if (outputImgData.data[i] === 255) {
+            unassigned++;
+          }
+        }
+        unassignedPixelsPerUpdate.push(unassigned);
+      });
+    } finally {
+      getTimeSpy.mockRestore();
+    }
+
+    // intermediate previews plus the final update
+    expect(unassignedPixelsPerUpdate.length).toBeGreaterThan(1);
+    expect(unassignedPixelsPerUpdate.every((unassigned) => unassigned === 0)).toBe(true);
+  });
+});
@@ -13,16 +13,14 @@ import { ClusteringColorSpace } from '../../../src/settings';
 
 describe('Constants Module', () => {
   describe('ColorSpace enum', () => {
-    it('should re-export ClusteringColorSpace as ColorSpace', () => {
-      expect(ColorSpace.RGB).toBe(ClusteringColorSpace.RGB);
-      expect(ColorSpace.HSL).toBe(ClusteringColorSpace.HSL);
-      expect(ColorSpace.LAB).toBe(ClusteringColorSpace.LAB);
-    });
-
-    it('should have correct numeric values', () => {
-      expect(ColorSpace.RGB).toBe(0);
-      expect(ColorSpace.HSL).toBe(1);
-      expect(ColorSpace.LAB).toBe(2);
+    it.each([
+      ['RGB', 0],
+      ['HSL', 1],
+      ['LAB', 2],
+    ] as const)('should map %s to %i and back, same as ClusteringColorSpace', (name: 'RGB' | 'HSL' | 'LAB', value: number) => {
+      expect(ColorSpace[name]).toBe(value);
+      expect(ColorSpace[value]).toBe(name);
+      expect(ClusteringColorSpace[name]).toBe(value);
     });
   });
 
@@ -0,0 +1,26 @@
+import { getResizedDimensions } from '../../../src/lib/imageSize';
+
+describe('imageSize', () => {
+  describe('getResizedDimensions', () => {
+    it('should return null when the image already fits', () => {
+      expect(getResizedDimensions(80, 60, 100, 100)).toBeNull();
+      expect(getResizedDimensions(100, 100, 100, 100)).toBeNull();
+    });
+
+    it('should preserve the aspect ratio of a wide image', () => {
+      expect(getResizedDimensions(200, 100, 100, 100)).toEqual({ width: 100, height: 50 });
+    });
+
+    it('should preserve the aspect ratio of a tall image', () => {
+      expect(getResizedDimensions(100, 400, 100, 100)).toEqual({ width: 25, height: 100 });
+    });
+
+    it('should fit both limits when width and height are too large', () => {
+      const size = getResizedDimensions(3000, 2000, 1024, 512)!;
+
+      expect(size.width).toBeLessThanOrEqual(1024);
+      expect(size.height).toBeLessThanOrEqual(512);
+      expect(size.width / size.height).toBeCloseTo(1.5);
+    });
+  });
+});
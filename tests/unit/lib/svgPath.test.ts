@@ -0,0 +1,22 @@
+import { getQuadraticPathData } from '../../../src/lib/svgPath';
+import { Point } from '../../../src/structs/point';
+
+describe('svgPath', () => {
+  describe('getQuadraticPathData', () => {
+    it('should only move to a single point', () => {
+      expect(getQuadraticPathData([new Point(3, 4)], 1)).toBe('M 3 4 ');
+    });
+
+    it('should use the midpoint to the previous point as control point', () => {
+      const path = [new Point(0, 0), new Point(2, 0), new Point(2, 2)];
+
+      expect(getQuadraticPathData(path, 1)).toBe('M 0 0 Q 1 0 2 0 Q 2 1 2 2 ');
+    });
+
+    it('should scale all coordinates by the size multiplier', () => {
+      const path = [new Point(0, 0), new Point(1, 3)];
+
+      expect(getQuadraticPathData(path, 10)).toBe('M 0 0 Q 5 15 10 30 ');
+    });
+  });
+});
@@ -0,0 +1,43 @@
+import { BoundingBox } from '../../../src/structs/boundingbox';
+
+function createBoundingBox(minX: number, minY: number, maxX: number, maxY: number): BoundingBox {
+  const bbox = new BoundingBox();
+  bbox.minX = minX;
+  bbox.minY = minY;
+  bbox.maxX = maxX;
+  bbox.maxY = maxY;
+  return bbox;
+}
+
+describe('BoundingBox', () => {
+  describe('contains', () => {
+    it('should include points on the boundary', () => {
+      const bbox = createBoundingBox(2, 3, 5, 7);
+      expect(bbox.contains(2, 3)).toBe(true);
+      expect(bbox.contains(5, 7)).toBe(true);
+      expect(bbox.contains(2, 7)).toBe(true);
+      expect(bbox.contains(4, 5)).toBe(true);
+    });
+
+    it('should exclude points outside on any side', () => {
+      const bbox = createBoundingBox(2, 3, 5, 7);
+      expect(bbox.contains(1, 5)).toBe(false);
+      expect(bbox.contains(6, 5)).toBe(false);
+      expect(bbox.contains(3, 2)).toBe(false);
+      expect(bbox.contains(3, 8)).toBe(false);
+    });
+
+    it('should handle fractional wall coordinates', () => {
+      const bbox = createBoundingBox(2, 3, 5, 7);
+      expect(bbox.contains(1.5, 5)).toBe(false);
+      expect(bbox.contains(2.5, 6.5)).toBe(true);
+      expect(bbox.contains(5.5, 5)).toBe(false);
+    });
+
+    it('should not contain anything when empty', () => {
+      const bbox = new BoundingBox();
+      expect(bbox.contains(0, 0)).toBe(false);
+      expect(bbox.contains(100, 100)).toBe(false);
+    });
+  });
+});
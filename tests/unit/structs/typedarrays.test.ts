@@ -0,0 +1,103 @@
+import { BooleanArray2D, Uint32Array2D, Uint8Array2D } from '../../../src/structs/typedarrays';
+
+describe('typed 2D arrays', () => {
+  describe('BooleanArray2D', () => {
+    it('should keep neighbouring cells independent', () => {
+      // 10 wide so rows don't end on a byte boundary
+      const arr = new BooleanArray2D(10, 3);
+      arr.set(7, 1, true);
+      arr.set(8, 1, true);
+      arr.set(9, 2, true);
+      arr.set(8, 1, false);
+
+      for (let y = 0; y < 3; y++) {
+        for (let x = 0; x < 10; x++) {
+          const expected = (x === 7 && y === 1) || (x === 9 && y === 2);
+          expect(arr.get(x, y)).toBe(expected);
+        }
+      }
+    });
+  });
+
+  describe('Uint8Array2D.matchAllAround', () => {
+    it('should match when all 4 neighbours have the value', () => {
+      const arr = new Uint8Array2D(3, 3);
+      arr.fill(2);
+      arr.set(0, 0, 1); // diagonals don't count
+
+      expect(arr.matchAllAround(1, 1, 2)).toBe(true);
+    });
+
+    it('should not match when a neighbour differs or lies outside the array', () => {
+      const arr = new Uint8Array2D(3, 3);
+      arr.fill(2);
+
+      expect(arr.matchAllAround(0, 1, 2)).toBe(false);
+      expect(arr.matchAllAround(1, 2, 2)).toBe(false);
+
+      arr.set(1, 0, 1);
+      expect(arr.matchAllAround(1, 1, 2)).toBe(false);
+    });
+  });
+
+  describe('fill', () => {
+    it('should set every cell', () => {
+      const arr = new Uint32Array2D(4, 3);
+      arr.fill(7);
+      for (let y = 0; y < 3; y++) {
+        for (let x = 0; x < 4; x++) {
+          expect(arr.get(x, y)).toBe(7);
+        }
+      }
+    });
+
+    it('should set every cell of a boolean array', () => {
+      const arr = new BooleanArray2D(3, 3);
+      arr.fill(true);
+      expect(arr.get(0, 0)).toBe(true);
+      expect(arr.get(2, 2)).toBe(true);
+
+      arr.fill(false);
+      expect(arr.get(1, 1)).toBe(false);
+    });
+  });
+
+  describe('fillRect', () => {
+    it('should only set cells inside the rectangle', () => {
+      const arr = new Uint8Array2D(5, 5);
+      arr.fillRect(1, 2, 3, 2, 9);
+
+      for (let y = 0; y < 5; y++) {
+        for (let x = 0; x < 5; x++) {
+          const inside = x >= 1 && x < 4 && y >= 2 && y < 4;
+          expect(arr.get(x, y)).toBe(inside ? 9 : 0);
+        }
+      }
+    });
+
+    it('should clip rectangles that extend past the array', () => {
+      const arr = new BooleanArray2D(4, 4);
+      arr.fillRect(2, -1, 10, 2, true);
+
+      expect(arr.get(2, 0)).toBe(true);
+      expect(arr.get(3, 0)).toBe(true);
+      expect(arr.get(1, 0)).toBe(false);
+      expect(arr.get(2, 1)).toBe(false);
+      // nothing should wrap around to the start of the next row
+      expect(arr.get(0, 1)).toBe(false);
+    });
+
+    it('should set and clear boolean spans that cross byte boundaries', () => {
+      const arr = new BooleanArray2D(30, 4);
+      arr.fillRect(3, 1, 22, 2, true);
+      arr.fillRect(5, 2, 1, 1, false);
+
+      for (let y = 0; y < 4; y++) {
+        for (let x = 0; x < 30; x++) {
+          const inside = x >= 3 && x < 25 && y >= 1 && y < 3 && !(x === 5 && y === 2);
+          expect(arr.get(x, y)).toBe(inside);
+        }
+      }
+    });
+  });
+});